@@ -0,0 +1,181 @@
+from asyncio import QueueEmpty, QueueFull
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, List, Optional
+
+import asyncio
+import itertools
+
+from minheap import MinHeap
+
+
+class AsyncMinHeap:
+    """
+    asyncio priority queue on top of MinHeap. Items are compared directly (or
+    through key=), so there is no need for (priority, counter, item) tuples,
+    and get_many(n) drains up to n items per wakeup, instead of one task
+    switch per item as with asyncio.PriorityQueue.get().
+
+    Getters are served fairly, in the order they started waiting: each one
+    takes a ticket, and waiting getters are kept in a MinHeap of
+    [ticket, future]. A getter woken up that finds the heap drained again
+    (e.g. by a get_many before it) goes back in line with its original
+    ticket, and new getters do not take items while others are waiting.
+    One getter is woken up per item not yet claimed by a woken getter.
+
+    With maxsize > 0 the heap is bounded and put() waits for room.
+
+    Cancelled getters and putters are skipped when they come up, as
+    TimerHeap does with tombstones, and counted: once they are more than
+    half of those waiting, they are dropped in O(n). An idle queue polled
+    with wait_for(get(), timeout) does not grow without bound.
+    """
+
+    def __init__(self, nodes: Optional[Iterable[Any]] = None, maxsize: int = 0,
+                 key: Optional[Callable[[Any], Any]] = None,
+                 reverse: bool = False):
+        self.maxsize = maxsize
+        self.__heap = MinHeap(nodes, key=key, reverse=reverse)
+        self.__getters = MinHeap()
+        self.__tickets = itertools.count()
+        # Getters woken up that did not run yet, each will claim an item
+        self.__woken = 0
+        self.__putters: Deque[asyncio.Future] = deque()
+        # Cancelled futures still in __getters and __putters
+        self.__cancelled_getters = 0
+        self.__cancelled_putters = 0
+
+    def __len__(self) -> int:
+        return len(self.__heap)
+
+    def qsize(self) -> int:
+        return len(self.__heap)
+
+    def empty(self) -> bool:
+        return self.__heap.is_empty()
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self.__heap)
+
+    def peek(self) -> Optional[Any]:
+        return self.__heap.peek()
+
+    def __wakeup_getters(self):
+        """ Wake up getters in ticket order, one per unclaimed item """
+        while self.__woken < len(self.__heap) and not self.__getters.is_empty():
+            _, getter = self.__getters.poll()
+            # Getters cancelled while waiting are skipped (lazy deletion)
+            if getter.done():
+                self.__cancelled_getters -= 1
+            else:
+                getter.set_result(None)
+                self.__woken += 1
+
+    def __wakeup_putters(self, count: int):
+        while count and self.__putters:
+            putter = self.__putters.popleft()
+            if putter.done():
+                self.__cancelled_putters -= 1
+            else:
+                putter.set_result(None)
+                count -= 1
+
+    def __cancel_getter(self, getter: asyncio.Future):
+        """ Cancels a getter still waiting in __getters """
+        getter.cancel()
+        self.__cancelled_getters += 1
+        if 2 * self.__cancelled_getters > len(self.__getters):
+            waiting = [entry for entry in self.__getters.nodes if not entry[1].done()]
+            self.__getters = MinHeap(waiting, copy=False)
+            self.__cancelled_getters = 0
+
+    def __cancel_putter(self, putter: asyncio.Future):
+        """ Cancels a putter still waiting in __putters """
+        putter.cancel()
+        self.__cancelled_putters += 1
+        if 2 * self.__cancelled_putters > len(self.__putters):
+            self.__putters = deque(putter for putter in self.__putters
+                                   if not putter.done())
+            self.__cancelled_putters = 0
+
+    def put_nowait(self, item: Any):
+        if self.full():
+            raise QueueFull
+        self.__heap.add(item)
+        self.__wakeup_getters()
+
+    async def put(self, item: Any):
+        while self.full():
+            putter = asyncio.get_running_loop().create_future()
+            self.__putters.append(putter)
+            try:
+                await putter
+            except asyncio.CancelledError:
+                if not putter.done() or putter.cancelled():
+                    self.__cancel_putter(putter)
+                elif not self.full():
+                    # Woken up but cancelled, pass the turn on
+                    self.__wakeup_putters(1)
+                raise
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        if self.__heap.is_empty():
+            raise QueueEmpty
+        item = self.__heap.poll()
+        self.__wakeup_putters(1)
+        return item
+
+    async def get(self) -> Any:
+        return (await self.get_many(1))[0]
+
+    async def get_many(self, n: int) -> List[Any]:
+        """
+        Waits for its turn and at least one item, then polls up to n items at
+        once, smallest first.
+        """
+        if self.__heap.is_empty() or self.__woken or not self.__getters.is_empty():
+            ticket = next(self.__tickets)
+            loop = asyncio.get_running_loop()
+            while True:
+                getter = loop.create_future()
+                self.__getters.add([ticket, getter])
+                # Items may be there already, waiting only to respect the line
+                self.__wakeup_getters()
+                try:
+                    await getter
+                except asyncio.CancelledError:
+                    if getter.done() and not getter.cancelled():
+                        # Woken up but cancelled, pass the item on
+                        self.__woken -= 1
+                        self.__wakeup_getters()
+                    else:
+                        self.__cancel_getter(getter)
+                    raise
+                self.__woken -= 1
+                if not self.__heap.is_empty():
+                    break
+        poll = self.__heap.poll
+        items = [poll() for _ in range(min(n, len(self.__heap)))]
+        self.__wakeup_putters(len(items))
+        self.__wakeup_getters()
+        return items
+
+
+if __name__ == '__main__':
+    async def main():
+        queue = AsyncMinHeap(key=lambda event: event['priority'])
+        batches = []
+
+        async def consumer():
+            while sum(map(len, batches)) < 5:
+                batches.append(await queue.get_many(10))
+
+        task = asyncio.create_task(consumer())
+        await asyncio.sleep(0)
+        for priority in (3, 1, 2, 5, 4):
+            queue.put_nowait({'priority': priority})
+        await task
+        print(f'batches: {[[e["priority"] for e in batch] for batch in batches]}')
+        # batches: [[1, 2, 3, 4, 5]]
+
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+A producer puts bursts of items while a consumer drains them: time and
+number of awaited get calls with asyncio.PriorityQueue.get(), AsyncMinHeap.get() and
+AsyncMinHeap.get_many(burst).
+
+Usage: python bench_async.py [items [burst]]   (defaults to 2*10^5 and 100)
+"""
+import asyncio
+import random
+import sys
+import time
+
+from async_minheap import AsyncMinHeap
+
+
+async def run(queue, items: int, burst: int, batched: bool) -> tuple:
+    """ Returns (seconds, awaited get calls) """
+    values = [random.randint(1, items) for _ in range(items)]
+    awaits = 0
+
+    async def producer():
+        for start in range(0, items, burst):
+            for value in values[start:start + burst]:
+                queue.put_nowait(value)
+            # Yield to the consumer between bursts
+            await asyncio.sleep(0)
+
+    async def consumer():
+        nonlocal awaits
+        received = 0
+        while received < items:
+            if batched:
+                received += len(await queue.get_many(burst))
+            else:
+                await queue.get()
+                received += 1
+            awaits += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(producer(), consumer())
+    return time.perf_counter() - start, awaits
+
+
+if __name__ == '__main__':
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 2 * 10**5
+    burst = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    print(f'{"queue":>26} {"time":>8} {"awaits":>9}')
+    for name, make_queue, batched in (
+            ('asyncio.PriorityQueue', asyncio.PriorityQueue, False),
+            ('AsyncMinHeap.get()', AsyncMinHeap, False),
+            (f'AsyncMinHeap.get_many({burst})', AsyncMinHeap, True)):
+        elapsed, awaits = asyncio.run(run(make_queue(), items, burst, batched))
+        print(f'{name:>26} {elapsed:>7.3f}s {awaits:>9,}')
+    # Sample run (CPython 3.11):
+    #                      queue     time    awaits
+    #      asyncio.PriorityQueue   0.255s   200,000
+    #         AsyncMinHeap.get()   0.677s   200,000
+    # AsyncMinHeap.get_many(100)   0.268s     2,000
+    # get_many() needs a hundredth of the awaits; the time left is mostly the
+    # pure Python heap against the C heapq inside asyncio.PriorityQueue.
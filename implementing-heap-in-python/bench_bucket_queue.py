@@ -0,0 +1,56 @@
+"""
+Steady-state queue of n items with priorities in range(256): each step
+polls one item and adds one. MinHeap needs [priority, sequence, item] nodes
+to keep items of the same priority in FIFO order, BucketQueue does not.
+
+Usage: python bench_bucket_queue.py [size ...]   (defaults to 10^3, 10^5 and 10^6)
+"""
+import itertools
+import random
+import sys
+import time
+
+from bucket_queue import BucketQueue
+from minheap import MinHeap
+
+LEVELS = 256
+STEPS = 200_000
+
+
+def steady_minheap(size: int) -> float:
+    sequence = itertools.count()
+    heap = MinHeap([[random.randrange(LEVELS), next(sequence), None]
+                    for _ in range(size)])
+    priorities = [random.randrange(LEVELS) for _ in range(STEPS)]
+    start = time.perf_counter()
+    for priority in priorities:
+        heap.poll()
+        heap.add([priority, next(sequence), None])
+    return STEPS / (time.perf_counter() - start)
+
+
+def steady_buckets(size: int) -> float:
+    queue = BucketQueue(LEVELS)
+    for _ in range(size):
+        queue.add(None, random.randrange(LEVELS))
+    priorities = [random.randrange(LEVELS) for _ in range(STEPS)]
+    start = time.perf_counter()
+    for priority in priorities:
+        queue.poll()
+        queue.add(None, priority)
+    return STEPS / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10**3, 10**5, 10**6]
+    print(f'{"n":>10} {"MinHeap":>10} {"BucketQueue":>12}   (poll+add/s)')
+    for size in sizes:
+        print(f'{size:>10} {steady_minheap(size):>10,.0f} {steady_buckets(size):>12,.0f}')
+    # Sample run (CPython 3.11):
+    #          n    MinHeap  BucketQueue   (poll+add/s)
+    #       1000    403,251    2,174,507
+    #     100000    234,552    2,225,552
+    #    1000000    167,138    2,601,305
+    # BucketQueue does the same work whatever the number of items, a few int
+    # operations on the bitmap plus a deque append/popleft, where MinHeap
+    # compares [priority, sequence, item] lists log2(n) times per operation.
@@ -0,0 +1,137 @@
+"""
+Dijkstra's shortest paths on a random sparse directed graph (n nodes, each
+with `degree` edges of random weight) with:
+- MinHeap, adding a new [distance, node] entry on every improvement and
+  skipping stale entries when polled (lazy deletion, no decrease-key).
+- IndexedMinHeap.decrease_key, heapifying up in O(log n).
+- PairingHeap.decrease_key, cutting and linking in O(1).
+- RadixHeap, with lazy deletion as MinHeap: weights are integers, so
+  distances are polled in non-decreasing order.
+
+Usage: python bench_dijkstra.py [n [degree]]   (defaults to 10^5 and 16)
+"""
+from typing import List, Tuple
+
+import random
+import sys
+import time
+
+from indexed_minheap import IndexedMinHeap
+from minheap import MinHeap
+from pairing_heap import PairingHeap
+from radix_heap import RadixHeap
+
+Graph = List[List[Tuple[int, int]]]
+
+
+def random_graph(n: int, degree: int) -> Graph:
+    return [[(random.randrange(n), random.randint(1, 10**6)) for _ in range(degree)]
+            for _ in range(n)]
+
+
+def dijkstra_minheap(graph: Graph, source: int) -> List[float]:
+    distances = [float('inf')] * len(graph)
+    distances[source] = 0
+    heap = MinHeap([[0, source]])
+    while not heap.is_empty():
+        distance, node = heap.poll()
+        if distance > distances[node]:
+            # Stale entry, the node was reached by a shorter path already
+            continue
+        for target, weight in graph[node]:
+            candidate = distance + weight
+            if candidate < distances[target]:
+                distances[target] = candidate
+                heap.add([candidate, target])
+    return distances
+
+
+def dijkstra_indexed(graph: Graph, source: int) -> List[float]:
+    distances = [float('inf')] * len(graph)
+    distances[source] = 0
+    heap = IndexedMinHeap()
+    heap.add(source, 0)
+    while not heap.is_empty():
+        node = heap.poll()
+        distance = distances[node]
+        for target, weight in graph[node]:
+            candidate = distance + weight
+            if candidate < distances[target]:
+                if target in heap:
+                    heap.decrease_key(target, candidate)
+                else:
+                    heap.add(target, candidate)
+                distances[target] = candidate
+    return distances
+
+
+def dijkstra_pairing(graph: Graph, source: int) -> List[float]:
+    distances = [float('inf')] * len(graph)
+    distances[source] = 0
+    handles = [None] * len(graph)
+    heap = PairingHeap()
+    handles[source] = heap.add(source, 0)
+    while not heap.is_empty():
+        node = heap.poll()
+        distance = distances[node]
+        for target, weight in graph[node]:
+            candidate = distance + weight
+            if candidate < distances[target]:
+                handle = handles[target]
+                if handle is None:
+                    handles[target] = heap.add(target, candidate)
+                else:
+                    heap.decrease_key(handle, candidate)
+                distances[target] = candidate
+    return distances
+
+
+def dijkstra_radix(graph: Graph, source: int) -> List[float]:
+    distances = [float('inf')] * len(graph)
+    distances[source] = 0
+    settled = bytearray(len(graph))
+    heap = RadixHeap()
+    heap.add(source, 0)
+    while not heap.is_empty():
+        node = heap.poll()
+        # Polled items carry no distance: skip stale entries of settled nodes
+        if settled[node]:
+            continue
+        settled[node] = 1
+        distance = distances[node]
+        for target, weight in graph[node]:
+            candidate = distance + weight
+            if candidate < distances[target]:
+                distances[target] = candidate
+                heap.add(target, candidate)
+    return distances
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    degree = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    graph = random_graph(n, degree)
+
+    expected = None
+    print(f'{"heap":>16} {"time (s)":>9}')
+    for name, dijkstra in (('MinHeap (lazy)', dijkstra_minheap),
+                           ('IndexedMinHeap', dijkstra_indexed),
+                           ('PairingHeap', dijkstra_pairing),
+                           ('RadixHeap', dijkstra_radix)):
+        start = time.perf_counter()
+        distances = dijkstra(graph, 0)
+        elapsed = time.perf_counter() - start
+        assert expected is None or distances == expected
+        expected = distances
+        print(f'{name:>16} {elapsed:>9.2f}')
+    # Sample runs (CPython 3.11):
+    # python bench_dijkstra.py            python bench_dijkstra.py 50000 64
+    #             heap  time (s)                      heap  time (s)
+    #   MinHeap (lazy)      1.88            MinHeap (lazy)      1.54
+    #   IndexedMinHeap      1.32            IndexedMinHeap      0.98
+    #      PairingHeap      1.03               PairingHeap      0.73
+    #        RadixHeap      1.00                 RadixHeap      0.86
+    # With more edges per node, more of the work is decrease-keys and the
+    # O(1) cut-and-link of PairingHeap pulls ahead. Lazy deletion pays for
+    # every stale entry twice, on add and on poll, but RadixHeap makes both
+    # cheap enough to keep up without decrease-key.
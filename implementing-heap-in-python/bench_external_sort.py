@@ -0,0 +1,49 @@
+"""
+External sort of n random int64 records with a shrinking memory budget:
+how many runs replacement selection writes, how long they are compared to
+the heap, and the time against sorted() on the whole input in memory.
+
+Usage: python bench_external_sort.py [n [memory ...]]   (defaults to 10^6 and 8, 2, 0.5 MiB)
+"""
+import random
+import sys
+import tempfile
+import time
+
+from external_sort import ENTRY_BYTES, external_sort, write_runs
+
+RECORD_FORMAT = 'q'
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    budgets = [int(float(arg) * 2**20) for arg in sys.argv[2:]] or \
+        [8 * 2**20, 2 * 2**20, 2**19]
+    values = [random.randint(0, 2**62) for _ in range(n)]
+
+    start = time.perf_counter()
+    sorted(values)
+    print(f'sorted() in memory: {time.perf_counter() - start:.2f}s\n')
+
+    print(f'{"memory":>10} {"heap":>8} {"runs":>6} {"run/heap":>9} {"time (s)":>9}')
+    for memory in budgets:
+        heap_size = memory // (ENTRY_BYTES + 8)
+        with tempfile.TemporaryDirectory() as directory:
+            runs = len(write_runs(values, directory, memory,
+                                  record_format=RECORD_FORMAT))
+        start = time.perf_counter()
+        for _ in external_sort(values, memory=memory, record_format=RECORD_FORMAT):
+            pass
+        elapsed = time.perf_counter() - start
+        print(f'{memory:>10,} {heap_size:>8,} {runs:>6} '
+              f'{n / runs / heap_size:>9.2f} {elapsed:>9.2f}')
+    # Sample run (CPython 3.11):
+    # sorted() in memory: 0.37s
+    #
+    #     memory     heap   runs  run/heap  time (s)
+    #  8,388,608   53,092     11      1.71      6.20
+    #  2,097,152   13,273     39      1.93      4.98
+    #    524,288    3,318    152      1.98      5.42
+    # Runs are about twice the heap size on random input (the last run is
+    # shorter, which shows with few runs). With fewer runs most of the time
+    # goes into the deeper heap of phase 1. With the default fan_in of 64,
+    # 152 runs are first merged down to 3, then into the output.
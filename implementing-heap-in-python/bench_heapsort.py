@@ -0,0 +1,37 @@
+"""
+Comparisons and time of the standard and bottom-up heapsort, on plain ints
+and on keys that are expensive to compare (Fraction, compared in Python code).
+
+Usage: python bench_heapsort.py [size ...]   (defaults to 10^4 up to 10^6)
+"""
+from fractions import Fraction
+
+import random
+import sys
+import time
+
+from heapsort import ComparisonCounter, heapsort
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10**4, 10**5, 10**6]
+    print(f'{"n":>10} {"keys":>9} {"mode":>10} {"comparisons":>12} {"time":>9}')
+    for size in sizes:
+        ints = [random.randint(1, size) for _ in range(size)]
+        fractions = [Fraction(value, 7) for value in ints]
+        for name, values in (('int', ints), ('Fraction', fractions)):
+            for bottom_up in (False, True):
+                counter = ComparisonCounter()
+                data = list(values)
+                start = time.perf_counter()
+                heapsort(data, bottom_up=bottom_up, counter=counter)
+                elapsed = time.perf_counter() - start
+                mode = 'bottom-up' if bottom_up else 'standard'
+                print(f'{size:>10} {name:>9} {mode:>10} '
+                      f'{counter.comparisons:>12,} {elapsed:>8.3f}s')
+    # Sample run (CPython 3.11, timings include counting):
+    #          n      keys       mode  comparisons      time
+    #     100000       int   standard    3,018,921    0.475s
+    #     100000       int  bottom-up    1,699,522    0.369s
+    #     100000  Fraction   standard    3,018,921    1.871s
+    #     100000  Fraction  bottom-up    1,699,522    1.179s
@@ -0,0 +1,81 @@
+"""
+Time and key comparisons of the heap-based merge (merge.py) against the loser
+tree merge (loser_tree.py) as the fan-in k grows, merging the same total
+number of values, to find the crossover point.
+
+Usage: python bench_loser_tree.py [total]   (defaults to 2^18 values)
+"""
+from typing import Any, Callable, Iterator, List
+
+import random
+import sys
+import time
+
+import loser_tree
+import merge
+
+
+class CountedKey:
+    """ Float key counting every comparison made on it """
+    __slots__ = ('value',)
+    comparisons = 0
+
+    def __init__(self, value: float):
+        self.value = value
+
+    def __lt__(self, other: 'CountedKey') -> bool:
+        CountedKey.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other: 'CountedKey') -> bool:
+        CountedKey.comparisons += 1
+        return self.value > other.value
+
+    def __eq__(self, other: object) -> bool:
+        CountedKey.comparisons += 1
+        return isinstance(other, CountedKey) and self.value == other.value
+
+
+def sorted_runs(k: int, total: int) -> List[List[float]]:
+    rng = random.Random(k)
+    return [sorted(rng.random() for _ in range(total // k)) for _ in range(k)]
+
+
+def run(merger: Callable[..., Iterator[Any]], runs: List[List[float]],
+        key: Any = None) -> int:
+    count = 0
+    for _ in merger(*runs, key=key):
+        count += 1
+    return count
+
+
+if __name__ == '__main__':
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2**18
+    engines = (('heap', merge.merge), ('loser tree', loser_tree.merge))
+    print(f'{"k":>6} {"engine":>11} {"time":>9} {"cmp/value":>10} {"counted time":>13}')
+    for exponent in range(1, 13):
+        k = 2 ** exponent
+        runs = sorted_runs(k, total)
+        for name, merger in engines:
+            start = time.perf_counter()
+            merged = run(merger, runs)
+            elapsed = time.perf_counter() - start
+            CountedKey.comparisons = 0
+            start = time.perf_counter()
+            run(merger, runs, key=CountedKey)
+            counted = time.perf_counter() - start
+            print(f'{k:>6} {name:>11} {elapsed:>8.3f}s '
+                  f'{CountedKey.comparisons / merged:>10.2f} {counted:>12.3f}s')
+    # Sample run (CPython 3.11, 2^18 values):
+    #      k      engine      time  cmp/value  counted time
+    #      2        heap    0.189s       2.00        0.418s
+    #      2  loser tree    0.164s       1.00        0.319s
+    #     64        heap    0.372s      18.43        1.464s
+    #     64  loser tree    0.297s       6.00        0.703s
+    #   4096        heap    0.750s      41.97        3.432s
+    #   4096  loser tree    0.526s      11.97        1.280s
+    # The heap compares [key, order, ...] lists, where each list comparison
+    # costs an == and a < on the keys, and heapify down compares both
+    # children; the loser tree does ceil(log2 k) plain key comparisons. In
+    # this run the loser tree is ahead from k = 2, and the gap grows with k
+    # and with the cost of a comparison.
@@ -0,0 +1,60 @@
+"""
+Tenant consolidation: t queues of m items each are merged one by one into
+a single queue. With array MinHeaps every merge concatenates the lists and
+heapifies, O(n) for the merged size; LeftistHeap.meld() is O(log n). Also
+reports poll() throughput on the merged queue, and the cost of settling
+into a MinHeap with to_minheap().
+
+Usage: python bench_meld.py [tenants [items]]   (defaults to 200 and 1000)
+"""
+import random
+import sys
+import time
+
+from leftist_heap import LeftistHeap
+from minheap import MinHeap
+
+POLLS = 100_000
+
+if __name__ == '__main__':
+    tenants = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    # Never poll more than the merged queue holds
+    polls = min(POLLS, tenants * items)
+    queues = [[random.randint(0, 10**9) for _ in range(items)] for _ in range(tenants)]
+
+    print(f'{"queue":>12} {"merges (s)":>11} {"poll/s":>10}')
+    heaps = [MinHeap(queue) for queue in queues]
+    start = time.perf_counter()
+    merged = heaps[0]
+    for heap in heaps[1:]:
+        merged = MinHeap(merged.nodes + heap.nodes, copy=False)
+    merge_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(polls):
+        merged.poll()
+    print(f'{"MinHeap":>12} {merge_time:>11.3f} {polls / (time.perf_counter() - start):>10,.0f}')
+
+    heaps = [LeftistHeap(queue) for queue in queues]
+    start = time.perf_counter()
+    merged = heaps[0]
+    for heap in heaps[1:]:
+        merged.meld(heap)
+    merge_time = time.perf_counter() - start
+    start = time.perf_counter()
+    settled = merged.to_minheap()
+    settle_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(polls):
+        merged.poll()
+    print(f'{"LeftistHeap":>12} {merge_time:>11.3f} {polls / (time.perf_counter() - start):>10,.0f}')
+    print(f'\nto_minheap() of {len(settled):,} items: {settle_time:.3f}s')
+    # Sample run (CPython 3.11):
+    #        queue  merges (s)     poll/s
+    #      MinHeap       2.635    328,057
+    #  LeftistHeap       0.002    189,252
+    #
+    # to_minheap() of 200,000 items: 0.089s
+    # Melding is over 1000x faster, and polling a LeftistHeap about half as
+    # fast, chasing node pointers instead of indexing a list. Once the queue
+    # stops being merged, to_minheap() gets the array heap back in O(n).
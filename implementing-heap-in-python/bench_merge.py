@@ -0,0 +1,57 @@
+"""
+Time and peak memory of merging k sorted runs with the lazy merge() against
+sorted(chain(...)), for a 1000-way fan-in by default.
+
+Usage: python bench_merge.py [k [run_length]]   (defaults to 1000 and 1000)
+"""
+from itertools import chain
+
+import random
+import sys
+import time
+import tracemalloc
+
+from merge import merge
+
+
+def sorted_run(seed: int, run_length: int):
+    """ Lazily generated sorted run, a running sum of random increments """
+    rng = random.Random(seed)
+    value = 0.0
+    for _ in range(run_length):
+        value += rng.random()
+        yield value
+
+
+def runs(k: int, run_length: int):
+    return [sorted_run(seed, run_length) for seed in range(k)]
+
+
+def consume(iterator) -> int:
+    count = 0
+    for _ in iterator:
+        count += 1
+    return count
+
+
+if __name__ == '__main__':
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    run_length = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    print(f'{"merge":>20} {"time":>9} {"peak memory":>12}')
+    for name, merger in (('merge()', lambda its: merge(*its)),
+                         ('sorted(chain(...))', lambda its: sorted(chain(*its)))):
+        start = time.perf_counter()
+        consume(merger(runs(k, run_length)))
+        elapsed = time.perf_counter() - start
+        # Measure memory on a separate run, tracemalloc slows everything down
+        tracemalloc.start()
+        consume(merger(runs(k, run_length)))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{name:>20} {elapsed:>8.3f}s {peak / 2**20:>10.1f}MB')
+    # Sample run (CPython 3.11, k=1000, 1000 values per run):
+    #                merge      time  peak memory
+    #              merge()    2.084s        3.3MB
+    #   sorted(chain(...))    0.225s       35.0MB
+    # sorted() runs in C so it is faster while everything fits in memory, but
+    # merge() memory only grows with k, not with the total number of values.
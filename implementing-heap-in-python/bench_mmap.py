@@ -0,0 +1,70 @@
+"""
+MinHeap of n int64 priorities kept in a memory-mapped file (MmapStorage)
+against an in-memory array('q'): add/poll throughput, and the time to get
+the heap back after a restart, reopening the file instead of rebuilding.
+
+Usage: python bench_mmap.py [size ...]   (defaults to 10^6)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from minheap import MinHeap
+
+
+def rates(heap: MinHeap, operations: int) -> tuple:
+    """ Returns (add/s, poll/s) """
+    start = time.perf_counter()
+    for _ in range(operations):
+        heap.poll()
+    poll_rate = operations / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for value in range(operations):
+        heap.add(value)
+    add_rate = operations / (time.perf_counter() - start)
+    return add_rate, poll_rate
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10**6]
+    print(f'{"n":>10} {"storage":>16} {"add/s":>10} {"poll/s":>10} {"reopen (s)":>11}')
+    for size in sizes:
+        values = [random.randint(0, 2**40) for _ in range(size)]
+        operations = min(size, 10**5)
+
+        start = time.perf_counter()
+        heap = MinHeap(values, typecode='q')
+        rebuild = time.perf_counter() - start
+        add_rate, poll_rate = rates(heap, operations)
+        print(f'{size:>10} {"array(q)":>16} {add_rate:>10,.0f} {poll_rate:>10,.0f} '
+              f'{rebuild:>11.4f}')
+
+        for name, options in (('mmap', {}),
+                              ('mmap prefetch', {'prefetch_pages': 16}),
+                              ('mmap fsync', {'fsync': 'always'})):
+            path = os.path.join(tempfile.mkdtemp(), 'bench.heap')
+            heap = MinHeap.from_mmap(path, **options)
+            heap.nodes.extend(sorted(values))
+            heap.nodes.close()
+            start = time.perf_counter()
+            heap = MinHeap.from_mmap(path, **options)
+            reopen = time.perf_counter() - start
+            add_rate, poll_rate = rates(
+                heap, operations if options.get('fsync') != 'always' else 1000)
+            heap.nodes.close()
+            os.remove(path)
+            print(f'{size:>10} {name:>16} {add_rate:>10,.0f} {poll_rate:>10,.0f} '
+                  f'{reopen:>11.4f}')
+    # Sample run (CPython 3.11, Linux, file in the page cache):
+    #          n          storage      add/s     poll/s  reopen (s)
+    #    1000000         array(q)    869,457    101,957      0.6665
+    #    1000000             mmap    404,311     40,781      0.0002
+    #    1000000    mmap prefetch    293,554     37,701      0.0002
+    #    1000000       mmap fsync     13,121      6,678      0.0002
+    # Reopening only maps the file, where array(q) has to heapify n values
+    # again. Per operation the file is about 2.5x slower than array(q), since
+    # every read goes through MmapStorage.__getitem__. Prefetch only pays off
+    # once the file is larger than RAM and the top pages would be evicted;
+    # here everything is cached already. fsync='always' is bound by the disk.
@@ -0,0 +1,95 @@
+"""
+Quality and throughput of MultiQueue against a single ConcurrentMinHeap.
+
+Rank error: with a single thread, every polled item is looked up among the
+items still in the queue; its rank is how many smaller items it skipped
+(always 0 for an exact priority queue).
+
+Throughput: T threads, each doing alternating add() and poll() on a shared
+queue prefilled with n items.
+
+Usage: python bench_multiqueue.py [n [threads ...]]   (defaults to 10^5 and 1 2 4 8)
+"""
+from bisect import bisect_left, insort
+from typing import Callable, List
+
+import random
+import statistics
+import sys
+import threading
+import time
+
+from concurrent_minheap import ConcurrentMinHeap
+from multiqueue import MultiQueue
+
+
+def rank_errors(queue: MultiQueue, n: int) -> List[int]:
+    live = sorted(random.random() for _ in range(n))
+    for value in live:
+        queue.add(value)
+    errors = []
+    for _ in range(n):
+        # Keep the queue size steady: one add per poll
+        value = random.random()
+        queue.add(value)
+        insort(live, value)
+        polled = queue.poll()
+        rank = bisect_left(live, polled)
+        errors.append(rank)
+        del live[rank]
+    return errors
+
+
+def throughput(add: Callable[[float], None], poll: Callable[[], float],
+               threads: int, operations: int) -> float:
+    def worker():
+        for _ in range(operations // 2):
+            add(random.random())
+            poll()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return threads * operations / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    thread_counts = [int(arg) for arg in sys.argv[2:]] or [1, 2, 4, 8]
+
+    print(f'{"threads":>8} {"heaps":>6} {"mean rank":>10} {"p99 rank":>9} {"max rank":>9}')
+    for threads in thread_counts:
+        queue = MultiQueue(threads=threads)
+        errors = sorted(rank_errors(queue, n // 10))
+        print(f'{threads:>8} {len(queue.heaps):>6} {statistics.mean(errors):>10.2f} '
+              f'{errors[len(errors) * 99 // 100]:>9} {errors[-1]:>9}')
+
+    print(f'\n{"threads":>8} {"ConcurrentMinHeap":>18} {"MultiQueue":>11}   (ops/s)')
+    for threads in thread_counts:
+        concurrent, multi = ConcurrentMinHeap(), MultiQueue(threads=threads)
+        rates = []
+        for add, poll in ((concurrent.put, concurrent.get_nowait),
+                          (multi.add, multi.poll)):
+            for _ in range(n):
+                add(random.random())
+            rates.append(throughput(add, poll, threads, n // threads))
+        print(f'{threads:>8} {rates[0]:>18,.0f} {rates[1]:>11,.0f}')
+    # Sample run (CPython 3.11, 1 CPU):
+    #  threads  heaps  mean rank  p99 rank  max rank
+    #        1      2       0.80         9        19
+    #        2      4       2.44        18        40
+    #        4      8       5.51        30        53
+    #        8     16      12.17        59       112
+    #
+    #  threads  ConcurrentMinHeap  MultiQueue   (ops/s)
+    #        1            391,301     436,691
+    #        2            415,738     388,097
+    #        4            390,871     421,926
+    #        8            364,355     442,054
+    # The rank error grows linearly with the number of heaps, as expected.
+    # With the GIL and a single CPU threads never run at the same time, so
+    # there is no contention for MultiQueue to remove: the scaling only
+    # shows with free-threaded builds, or with one heap per process.
@@ -0,0 +1,66 @@
+"""
+Memory held by a MinHeap of n integer deadlines with a list of ints, an
+array('q') and a NumPy buffer (when installed), plus push/poll throughput.
+
+Usage: python bench_storage.py [size ...]   (defaults to 10^6 and 10^7)
+"""
+from typing import Callable, List
+
+import random
+import sys
+import time
+import tracemalloc
+
+from minheap import MinHeap
+from storage import typed_storage
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BACKENDS = {
+    'list': lambda values: MinHeap(values),
+    "array('q')": lambda values: MinHeap(values, typecode='q'),
+}
+if np is not None:
+    BACKENDS['numpy'] = lambda values: MinHeap(
+        typed_storage('q', values, use_numpy=True), copy=False)
+
+
+def measure(build: Callable[[List[int]], MinHeap], size: int) -> tuple:
+    """ Returns (bytes per node, add/s, poll/s) """
+    tracemalloc.start()
+    # Generate values inside the trace so boxed ints count for the list
+    heap = build([random.randint(0, 2**40) for _ in range(size)])
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    operations = min(size, 10**5)
+    start = time.perf_counter()
+    for _ in range(operations):
+        heap.poll()
+    poll_rate = operations / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for value in range(operations):
+        heap.add(value)
+    add_rate = operations / (time.perf_counter() - start)
+    return current / size, add_rate, poll_rate
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10**6, 10**7]
+    print(f'{"n":>10} {"storage":>10} {"bytes/node":>10} {"add/s":>10} {"poll/s":>10}')
+    for size in sizes:
+        for name, build in BACKENDS.items():
+            per_node, add_rate, poll_rate = measure(build, size)
+            print(f'{size:>10} {name:>10} {per_node:>10.1f} '
+                  f'{add_rate:>10,.0f} {poll_rate:>10,.0f}')
+    # Sample run (CPython 3.11, NumPy 2.4):
+    #          n    storage bytes/node      add/s     poll/s
+    #    1000000       list       44.0  2,424,181    207,713
+    #    1000000 array('q')        8.0    811,575    122,903
+    #    1000000      numpy        8.0    285,913     16,126
+    # Typed storage boxes a new int on every read, so it trades speed for 5x
+    # less memory. NumpyStorage goes through Python-level __getitem__, and is
+    # mostly useful to share the buffer with NumPy code (see to_numpy()).
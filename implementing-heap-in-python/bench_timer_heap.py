@@ -0,0 +1,82 @@
+"""
+Timer churn: n timers are added with random deadlines in the future, 90% of
+them are cancelled before they fire, and the clock advances polling the due
+ones. Compares TimerHeap with different compaction ratios (None: tombstones
+are only dropped when they reach the root) and IndexedMinHeap.remove(),
+which removes cancelled timers eagerly in O(log n).
+
+Usage: python bench_timer_heap.py [n]   (defaults to 10^6)
+"""
+import random
+import sys
+import time
+
+from indexed_minheap import IndexedMinHeap
+from timer_heap import TimerHeap
+
+CANCELLED = 0.9
+# Deadlines are up to this many ticks after now, one timer is added per tick
+HORIZON = 100_000
+
+
+def churn_timer_heap(timers: TimerHeap, n: int) -> int:
+    """ Returns the largest heap array seen """
+    pending, largest = [], 0
+    for now in range(n):
+        pending.append(timers.add(now + random.randint(1, HORIZON), now))
+        if random.random() < CANCELLED:
+            # Cancel a random pending timer
+            index = random.randrange(len(pending))
+            pending[index], pending[-1] = pending[-1], pending[index]
+            timers.cancel(pending.pop())
+        timers.poll_due(now)
+        if now % 1000 == 0:
+            largest = max(largest, len(timers.nodes))
+            pending = [timer for timer in pending if timer.active]
+    return largest
+
+
+def churn_indexed(timers: IndexedMinHeap, n: int) -> int:
+    pending, largest = [], 0
+    for now in range(n):
+        pending.append(timers.add(now, now + random.randint(1, HORIZON)))
+        if random.random() < CANCELLED:
+            index = random.randrange(len(pending))
+            pending[index], pending[-1] = pending[-1], pending[index]
+            handle = pending.pop()
+            # Same as cancel() on a timer that fired already
+            if handle.item in timers:
+                timers.remove(handle)
+        while not timers.is_empty() and timers.nodes[0].priority <= now:
+            timers.poll()
+        if now % 1000 == 0:
+            largest = max(largest, len(timers.nodes))
+            pending = [handle for handle in pending if handle.item in timers]
+    return largest
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    print(f'{"queue":>28} {"ops/s":>10} {"max nodes":>10}')
+    for name, churn, queue in (
+            ('TimerHeap ratio=None', churn_timer_heap, TimerHeap(None)),
+            ('TimerHeap ratio=0.5', churn_timer_heap, TimerHeap(0.5)),
+            ('TimerHeap ratio=0.25', churn_timer_heap, TimerHeap(0.25)),
+            ('IndexedMinHeap.remove', churn_indexed, IndexedMinHeap())):
+        start = time.perf_counter()
+        largest = churn(queue, n)
+        rate = n / (time.perf_counter() - start)
+        print(f'{name:>28} {rate:>10,.0f} {largest:>10,}')
+    # Sample run (CPython 3.11):
+    #                        queue      ops/s  max nodes
+    #         TimerHeap ratio=None    147,263     50,345
+    #          TimerHeap ratio=0.5    213,592     19,118
+    #         TimerHeap ratio=0.25    209,751     12,784
+    #        IndexedMinHeap.remove    266,978      9,576
+    # Without compaction, cancelled timers pile up to 5x the active ones and
+    # every operation walks a deeper heap. Compaction keeps the heap within
+    # 1 / (1 - ratio) of the active timers. IndexedMinHeap is still faster
+    # here: a random node is usually near the bottom of the heap, so eager
+    # removal is cheap, and its handles compare priorities directly instead
+    # of [deadline, sequence, timer] lists. TimerHeap does not need hashable,
+    # unique items, and its cancel() is O(1).
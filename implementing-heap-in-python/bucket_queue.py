@@ -0,0 +1,67 @@
+from collections import deque
+from typing import Any, Deque, List, Optional
+
+
+class BucketQueue:
+    """
+    Priority queue for small integer priorities in range(levels), such as
+    0-255 QoS classes: one FIFO bucket (a deque) per priority, instead of a
+    comparison heap.
+
+    A bitmap, an int with bit p set while bucket p is not empty, finds the
+    smallest non-empty bucket with (bitmap & -bitmap).bit_length(), so add()
+    and poll() are O(1) and do not compare items. Items with the same
+    priority come out in the order they were added.
+    """
+
+    def __init__(self, levels: int = 256):
+        if levels < 1:
+            raise ValueError(f'levels must be at least 1, got {levels}')
+        self.levels = levels
+        self.__buckets: List[Deque[Any]] = [deque() for _ in range(levels)]
+        self.__bitmap = 0
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def is_empty(self) -> bool:
+        return not self.__size
+
+    def add(self, item: Any, priority: Optional[int] = None):
+        """ Adds item, with the item itself as priority by default """
+        if priority is None:
+            priority = item
+        if not 0 <= priority < self.levels:
+            raise ValueError(f'priority must be in range({self.levels}), got {priority!r}')
+        self.__buckets[priority].append(item)
+        self.__bitmap |= 1 << priority
+        self.__size += 1
+
+    def peek(self) -> Optional[Any]:
+        if not self.__size:
+            return None
+        bitmap = self.__bitmap
+        return self.__buckets[(bitmap & -bitmap).bit_length() - 1][0]
+
+    def poll(self) -> Optional[Any]:
+        if not self.__size:
+            print('Empty, not polling')
+            return None
+        bitmap = self.__bitmap
+        priority = (bitmap & -bitmap).bit_length() - 1
+        bucket = self.__buckets[priority]
+        item = bucket.popleft()
+        if not bucket:
+            self.__bitmap = bitmap ^ (1 << priority)
+        self.__size -= 1
+        return item
+
+
+if __name__ == '__main__':
+    packets = BucketQueue()
+    for packet, qos in (('video-1', 2), ('ssh-1', 0), ('bulk-1', 7),
+                        ('video-2', 2), ('ssh-2', 0)):
+        packets.add(packet, qos)
+    print(f'sent: {[packets.poll() for _ in range(len(packets))]}')
+    # sent: ['ssh-1', 'ssh-2', 'video-1', 'video-2', 'bulk-1']
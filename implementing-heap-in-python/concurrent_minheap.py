@@ -0,0 +1,149 @@
+from queue import Empty, Full
+from typing import Any, Callable, Iterable, List, Optional
+
+import threading
+import time
+
+from minheap import MinHeap
+
+
+class ConcurrentMinHeap:
+    """
+    Thread-safe priority queue on top of MinHeap, with the blocking interface
+    of queue.PriorityQueue (get/put with block and timeout, raising
+    queue.Empty and queue.Full) plus batched put_many/get_many.
+
+    A single lock guards the heap, and two conditions on that lock wake up
+    consumers when items arrive and producers when room frees up. Batched
+    operations take the lock once for the whole batch and wake up as many
+    waiters as items moved, instead of paying a lock round-trip and a
+    notification per item.
+
+    With maxsize > 0 the heap is bounded: put blocks until there is room,
+    applying backpressure to producers.
+    """
+
+    def __init__(self, nodes: Optional[Iterable[Any]] = None, maxsize: int = 0,
+                 key: Optional[Callable[[Any], Any]] = None,
+                 reverse: bool = False):
+        self.maxsize = maxsize
+        self.__heap = MinHeap(nodes, key=key, reverse=reverse)
+        self.__lock = threading.Lock()
+        self.__not_empty = threading.Condition(self.__lock)
+        self.__not_full = threading.Condition(self.__lock)
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__heap)
+
+    def __is_full(self) -> bool:
+        return 0 < self.maxsize <= len(self.__heap)
+
+    def __wait(self, condition: threading.Condition, ready: Callable[[], bool],
+               block: bool, timeout: Optional[float], error: type):
+        """ Wait on condition (lock held) until ready(), or raise error """
+        if ready():
+            return
+        if not block:
+            raise error
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return
+        if timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline = time.monotonic() + timeout
+        while not ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise error
+            condition.wait(remaining)
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        with self.__not_full:
+            self.__wait(self.__not_full, lambda: not self.__is_full(),
+                        block, timeout, Full)
+            self.__heap.add(item)
+            self.__not_empty.notify()
+
+    def put_nowait(self, item: Any):
+        self.put(item, block=False)
+
+    def put_many(self, items: Iterable[Any], block: bool = True,
+                 timeout: Optional[float] = None):
+        """
+        Adds all items taking the lock once. On a bounded heap, items are added
+        while there is room and the call then waits for consumers to make
+        more; on timeout, queue.Full is raised and the items already added
+        stay in the heap.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        heap, maxsize = self.__heap, self.maxsize
+        add = heap.add
+        with self.__not_full:
+            added = 0
+            try:
+                for item in items:
+                    if 0 < maxsize <= len(heap):
+                        # Let consumers in before blocking on them
+                        self.__not_empty.notify(added)
+                        added = 0
+                        remaining = None
+                        if deadline is not None:
+                            remaining = max(deadline - time.monotonic(), 0)
+                        self.__wait(self.__not_full, lambda: not self.__is_full(),
+                                    block, remaining, Full)
+                    add(item)
+                    added += 1
+            finally:
+                self.__not_empty.notify(added)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        with self.__not_empty:
+            self.__wait(self.__not_empty, lambda: not self.__heap.is_empty(),
+                        block, timeout, Empty)
+            item = self.__heap.poll()
+            self.__not_full.notify()
+            return item
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def get_many(self, n: int, block: bool = True,
+                 timeout: Optional[float] = None) -> List[Any]:
+        """
+        Polls up to n items taking the lock once, smallest first. Waits (as
+        get) only until at least one item is available.
+        """
+        with self.__not_empty:
+            self.__wait(self.__not_empty, lambda: not self.__heap.is_empty(),
+                        block, timeout, Empty)
+            poll = self.__heap.poll
+            items = [poll() for _ in range(min(n, len(self.__heap)))]
+            self.__not_full.notify(len(items))
+            return items
+
+    def peek(self) -> Optional[Any]:
+        with self.__lock:
+            return self.__heap.peek()
+
+    def is_empty(self) -> bool:
+        with self.__lock:
+            return self.__heap.is_empty()
+
+
+if __name__ == '__main__':
+    jobs = ConcurrentMinHeap(maxsize=4)
+    consumed = []
+
+    def consumer():
+        while len(consumed) < 10:
+            consumed.extend(jobs.get_many(3, timeout=1))
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    # Blocks while the consumer makes room
+    jobs.put_many(range(10, 0, -1))
+    thread.join()
+    print(f'consumed: {len(consumed)}, empty: {jobs.is_empty()}')
+    # consumed: 10, empty: True
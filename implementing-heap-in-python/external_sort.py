@@ -0,0 +1,224 @@
+"""
+External merge sort, for inputs larger than memory, on MinHeap.
+
+Phase 1, replacement selection: a heap of up to `capacity` records is
+filled from the input, and the smallest is written to the current sorted
+run on disk and replaced by the next input record. If that record is not
+smaller than the one just written it still fits in the current run,
+otherwise it is tagged for the next run, and the heap orders records by
+(run, key). On random input, runs come out about twice as long as the heap,
+so there are half as many runs to merge as when sorting memory-sized chunks;
+already sorted input makes a single run.
+
+Phase 2: the runs are merged with merge.merge, at most fan_in runs at a
+time, reading each run sequentially through its own buffer.
+
+Records are read and written as a stream of pickles, or, given a struct
+record_format such as 'qd', as fixed-width binary records (tuples, or plain
+values for single-field formats like 'q'), which are smaller and faster.
+"""
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional
+
+import operator
+import os
+import pickle
+import struct
+import tempfile
+
+from merge import merge
+from minheap import MinHeap
+
+# Rough size in memory of a heap entry, on top of the record itself: the
+# entry list, its run number, key reference and sequence number
+ENTRY_BYTES = 150
+# Runs merged at once; more runs are merged in several passes
+MAX_FAN_IN = 64
+_READ_SIZE = 2**16
+
+
+def _record_writer(file: BinaryIO,
+                   record_format: Optional[str]) -> Callable[[Any], None]:
+    """ Function writing one record to file """
+    if record_format is None:
+        pickler = pickle.Pickler(file, pickle.HIGHEST_PROTOCOL)
+
+        def write(record: Any):
+            pickler.dump(record)
+            # Do not keep every record in the pickler memo
+            pickler.clear_memo()
+        return write
+    record = struct.Struct(record_format)
+    if _field_count(record) == 1:
+        return lambda value: file.write(record.pack(value))
+    return lambda values: file.write(record.pack(*values))
+
+
+def write_records(file: BinaryIO, records: Iterable[Any],
+                  record_format: Optional[str] = None):
+    """ Writes records to a binary file, pickled or as fixed-width records """
+    write = _record_writer(file, record_format)
+    for record in records:
+        write(record)
+
+
+def read_records(file: BinaryIO,
+                 record_format: Optional[str] = None) -> Iterator[Any]:
+    """ Streams back the records written by write_records """
+    if record_format is None:
+        unpickler = pickle.Unpickler(file)
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                return
+    record = struct.Struct(record_format)
+    single = _field_count(record) == 1
+    # Read whole records only, so every chunk unpacks on its own
+    read_size = _READ_SIZE - _READ_SIZE % record.size or record.size
+    while True:
+        chunk = file.read(read_size)
+        if not chunk:
+            return
+        if len(chunk) % record.size:
+            raise ValueError(f'Truncated record at the end of {file.name!r}')
+        if single:
+            for values in record.iter_unpack(chunk):
+                yield values[0]
+        else:
+            yield from record.iter_unpack(chunk)
+
+
+def _field_count(record: struct.Struct) -> int:
+    return len(record.unpack(bytes(record.size)))
+
+
+def _record_bytes(record: Any, record_format: Optional[str]) -> int:
+    if record_format is not None:
+        return struct.calcsize(record_format)
+    return len(pickle.dumps(record, pickle.HIGHEST_PROTOCOL))
+
+
+def write_runs(records: Iterable[Any], directory: str, memory: int,
+               key: Optional[Callable[[Any], Any]] = None, reverse: bool = False,
+               record_format: Optional[str] = None) -> List[str]:
+    """
+    Replacement selection: writes records to sorted run files in directory,
+    holding about memory bytes of records in the heap (estimated from the
+    size of the first record), and returns their paths in run order.
+
+    Heap entries are [run, key, sequence, record]: records of the current run
+    come before those of the next one, and the input sequence number breaks
+    ties so the sort is stable and records are never compared. As in
+    merge.merge, with reverse the max-heap needs run and sequence negated.
+    """
+    records = iter(records)
+    direction = -1 if reverse else 1
+    lt = operator.gt if reverse else operator.lt
+    entries: List[List[Any]] = []
+    capacity = None
+    for sequence, record in enumerate(records):
+        if capacity is None:
+            capacity = max(1, memory // (ENTRY_BYTES
+                                         + _record_bytes(record, record_format)))
+        entries.append([0, record if key is None else key(record),
+                        sequence * direction, record])
+        if len(entries) == capacity:
+            break
+    heap = MinHeap(entries, copy=False, reverse=reverse)
+
+    paths: List[str] = []
+    sequence = len(entries)
+    run = None
+    file = None
+    try:
+        while not heap.is_empty():
+            entry = heap.peek()
+            if entry[0] != run:
+                if file is not None:
+                    file.close()
+                run = entry[0]
+                paths.append(os.path.join(directory, f'run-{len(paths):06d}'))
+                file = open(paths[-1], 'wb')
+                write = _record_writer(file, record_format)
+            write(entry[3])
+            try:
+                record = next(records)
+            except StopIteration:
+                heap.poll()
+                continue
+            record_key = record if key is None else key(record)
+            # Smaller than what was just written: it goes to the next run
+            next_run = run + direction if lt(record_key, entry[1]) else run
+            heap.replace([next_run, record_key, sequence * direction, record])
+            sequence += 1
+    finally:
+        if file is not None:
+            file.close()
+    return paths
+
+
+def _read_run(path: str, record_format: Optional[str],
+              buffer_size: int) -> Iterator[Any]:
+    with open(path, 'rb', buffering=buffer_size) as file:
+        yield from read_records(file, record_format)
+
+
+def external_sort(records: Iterable[Any], key: Optional[Callable[[Any], Any]] = None,
+                  reverse: bool = False, memory: int = 64 * 2**20,
+                  temp_dir: Optional[str] = None,
+                  record_format: Optional[str] = None,
+                  fan_in: int = MAX_FAN_IN) -> Iterator[Any]:
+    """
+    Lazily sorts records of any size, like sorted(records, key=key,
+    reverse=reverse) but holding about memory bytes in the heap. Sorted runs
+    are written to a temporary directory inside temp_dir (the system default
+    when None), which is removed once the output is consumed or closed.
+    """
+    if fan_in < 2:
+        raise ValueError(f'fan_in must be at least 2, got {fan_in}')
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        runs = write_runs(records, directory, memory, key, reverse, record_format)
+        buffer_size = max(memory // (fan_in + 1), _READ_SIZE)
+        passes = 0
+        while len(runs) > fan_in:
+            # Merge fan_in runs at a time, keeping them in order for stability
+            merged = []
+            for first in range(0, len(runs), fan_in):
+                group = runs[first:first + fan_in]
+                path = os.path.join(directory, f'pass-{passes}-{len(merged):06d}')
+                with open(path, 'wb', buffering=buffer_size) as file:
+                    write_records(file, merge(
+                        *(_read_run(run, record_format, buffer_size) for run in group),
+                        key=key, reverse=reverse), record_format)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            passes += 1
+        yield from merge(*(_read_run(run, record_format, buffer_size) for run in runs),
+                         key=key, reverse=reverse)
+
+
+def sort_file(input_path: str, output_path: str,
+              key: Optional[Callable[[Any], Any]] = None, reverse: bool = False,
+              memory: int = 64 * 2**20, temp_dir: Optional[str] = None,
+              record_format: Optional[str] = None, fan_in: int = MAX_FAN_IN):
+    """ Sorts a file of records written by write_records into output_path """
+    with open(input_path, 'rb') as source, open(output_path, 'wb') as target:
+        write_records(target, external_sort(
+            read_records(source, record_format), key=key, reverse=reverse,
+            memory=memory, temp_dir=temp_dir, record_format=record_format,
+            fan_in=fan_in), record_format)
+
+
+if __name__ == '__main__':
+    import random
+
+    values = [random.randint(0, 10**6) for _ in range(100_000)]
+    with tempfile.TemporaryDirectory() as directory:
+        # 10^6 bytes of memory hold about 6,000 fixed-width 'q' records
+        runs = write_runs(values, directory, 10**6, record_format='q')
+        print(f'runs: {len(runs)}, about {len(values) // len(runs)} records each')
+    print(f'sorted: {list(external_sort(values, memory=10**6)) == sorted(values)}')
+    # runs: 9, about 11111 records each
+    # sorted: True
@@ -0,0 +1,156 @@
+from typing import Any, Callable, List, Optional
+
+import operator
+
+
+def _sift_down(data: List[Any], lo: int, index: int, size: int,
+               key: Optional[Callable[[Any], Any]],
+               dominates: Callable[[Any, Any], bool]):
+    """
+    Heapify down data[lo + index] within the heap stored in data[lo:lo + size].
+    Uses the same "hole" approach as MinHeap.__heapify_down, where a parent
+    must dominate its children (be greater for a max-heap, smaller for a
+    min-heap).
+    """
+    item = data[lo + index]
+    if key is None:
+        item_key = item
+    else:
+        item_key = key(item)
+    child = 2 * index + 1
+    while child < size:
+        child_key = data[lo + child] if key is None else key(data[lo + child])
+        right = child + 1
+        if right < size:
+            right_key = data[lo + right] if key is None else key(data[lo + right])
+            if dominates(right_key, child_key):
+                child = right
+                child_key = right_key
+        if not dominates(child_key, item_key):
+            break
+        # Move dominating child up into the hole
+        data[lo + index] = data[lo + child]
+        index = child
+        child = 2 * index + 1
+    data[lo + index] = item
+
+
+def _sift_down_bottom_up(data: List[Any], lo: int, index: int, size: int,
+                         key: Optional[Callable[[Any], Any]],
+                         dominates: Callable[[Any, Any], bool]):
+    """
+    Bottom-up (Floyd/Wegener) variant of _sift_down. In sort-down, the node
+    moved to the root comes from the bottom of the heap and almost always
+    goes back near a leaf, so comparing it at every level is wasted work.
+
+    Instead, walk the path of dominating children down to a leaf with one
+    comparison per level, moving each child up into the hole, and then sift
+    the item back up from the leaf, which usually takes one or two levels.
+    """
+    item = data[lo + index]
+    if key is None:
+        item_key = item
+    else:
+        item_key = key(item)
+    start = index
+    child = 2 * index + 1
+    while child < size:
+        right = child + 1
+        if right < size:
+            if key is None:
+                right_wins = dominates(data[lo + right], data[lo + child])
+            else:
+                right_wins = dominates(key(data[lo + right]), key(data[lo + child]))
+            if right_wins:
+                child = right
+        data[lo + index] = data[lo + child]
+        index = child
+        child = 2 * index + 1
+    # The hole is at a leaf now, move it back up to where item belongs
+    while index > start:
+        parent = (index - 1) >> 1
+        parent_key = data[lo + parent] if key is None else key(data[lo + parent])
+        if not dominates(item_key, parent_key):
+            break
+        data[lo + index] = data[lo + parent]
+        index = parent
+    data[lo + index] = item
+
+
+class ComparisonCounter:
+    """
+    Counts the comparisons made by heapsort(counter=...), useful to check how
+    many key comparisons each mode does on a given key type.
+    """
+    comparisons: int
+
+    def __init__(self):
+        self.comparisons = 0
+
+    def wrap(self, compare: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+        def counted(first: Any, second: Any) -> bool:
+            self.comparisons += 1
+            return compare(first, second)
+        return counted
+
+
+def heapsort(data: List[Any], lo: int = 0, hi: Optional[int] = None,
+             key: Optional[Callable[[Any], Any]] = None,
+             reverse: bool = False, bottom_up: bool = False,
+             counter: Optional[ComparisonCounter] = None) -> List[Any]:
+    """
+    Heapsort in-place using O(1) auxiliary space: sorts data[lo:hi] and leaves
+    the rest of the buffer untouched. Returns data itself.
+
+    The slice is turned into a heap in O(n) (a max-heap when sorting in
+    ascending order), then the sort-down phase repeatedly swaps the root to
+    the end of the heap, shrinks the heap by 1 and heapifies down the new root.
+
+    Since keys are not stored anywhere, key is called at each comparison; for
+    expensive keys, sorting with decorated (key, item) pairs trades O(n)
+    memory for fewer calls. Like any heapsort, this is not stable.
+
+    With bottom_up=True, heapify down walks to a leaf with one comparison per
+    level and sifts back up (see _sift_down_bottom_up), which does about half
+    the comparisons when they are expensive. Pass a ComparisonCounter to
+    count the comparisons made.
+    """
+    if hi is None:
+        hi = len(data)
+    if lo < 0 or hi > len(data) or lo > hi:
+        raise IndexError(f'Slice [{lo}:{hi}) out of range')
+    # Ascending order takes the largest to the end first (max-heap)
+    dominates = operator.lt if reverse else operator.gt
+    if counter is not None:
+        dominates = counter.wrap(dominates)
+    sift_down = _sift_down_bottom_up if bottom_up else _sift_down
+    size = hi - lo
+    for index in range(size // 2 - 1, -1, -1):
+        sift_down(data, lo, index, size, key, dominates)
+    for end in range(size - 1, 0, -1):
+        # Root goes to its final position right after the shrunk heap
+        data[lo], data[lo + end] = data[lo + end], data[lo]
+        sift_down(data, lo, 0, end, key, dominates)
+    return data
+
+
+if __name__ == '__main__':
+    unsorted_array = [10, 15, 8, 20, 17]
+    print(f'heapsort: {heapsort(unsorted_array)}')
+    print(f'identity check: {heapsort(unsorted_array) is unsorted_array}')
+    print(f'reverse: {heapsort(unsorted_array, reverse=True)}')
+    print(f'key: {heapsort(["bb", "a", "dddd", "ccc"], key=len)}')
+    print(f'slice [1:4): {heapsort([9, 3, 2, 1, 0], lo=1, hi=4)}')
+    # heapsort: [8, 10, 15, 17, 20]
+    # identity check: True
+    # reverse: [20, 17, 15, 10, 8]
+    # key: ['a', 'bb', 'ccc', 'dddd']
+    # slice [1:4): [9, 1, 2, 3, 0]
+
+    random_array = [(7919 * i) % 1000 for i in range(1000)]
+    for bottom_up in (False, True):
+        counter = ComparisonCounter()
+        heapsort(list(random_array), bottom_up=bottom_up, counter=counter)
+        print(f'bottom_up={bottom_up}: {counter.comparisons} comparisons')
+    # bottom_up=False: 16837 comparisons
+    # bottom_up=True: 10309 comparisons
@@ -0,0 +1,173 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Union
+
+
+class Handle:
+    """
+    Reference to an item inside an IndexedMinHeap. It keeps the current index
+    of the item in the heap array, so finding it again is O(1).
+    """
+    __slots__ = ('item', 'priority', 'index')
+
+    def __init__(self, item: Any, priority: Any, index: int):
+        self.item = item
+        self.priority = priority
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f'Handle({self.item!r}, priority={self.priority!r})'
+
+
+class IndexedMinHeap:
+    """
+    MinHeap keeping a position map from each item (and its Handle) to its index
+    in the array, which allows changing the priority of, or removing, any item
+    in O(log n) instead of rebuilding the heap or adding stale duplicates.
+
+    Every time a node moves in the array, in the heapify loops or when the
+    last node fills the place of a removed one, the index stored in its
+    Handle is updated. Items must be hashable and unique, since they are
+    also mapped to their handles.
+    """
+    nodes: List[Handle]
+
+    def __init__(self):
+        self.nodes = []
+        self.__handles: Dict[Any, Handle] = {}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.__handles
+
+    def __get_parent_index(self, child_index: int) -> int:
+        return (child_index - 1) // 2
+
+    def __get_left_child_index(self, parent_index: int) -> int:
+        return 2 * parent_index + 1
+
+    def __heapify_up(self, child: int):
+        """ Same "hole" approach as MinHeap, updating the moved handles """
+        nodes = self.nodes
+        handle = nodes[child]
+        priority = handle.priority
+        while child > 0:
+            parent_idx = self.__get_parent_index(child)
+            parent = nodes[parent_idx]
+            if not priority < parent.priority:
+                break
+            nodes[child] = parent
+            parent.index = child
+            child = parent_idx
+        nodes[child] = handle
+        handle.index = child
+
+    def __heapify_down(self, index: int):
+        """ Same "hole" approach as MinHeap, updating the moved handles """
+        nodes = self.nodes
+        size = len(nodes)
+        handle = nodes[index]
+        priority = handle.priority
+        child = self.__get_left_child_index(index)
+        while child < size:
+            smaller = nodes[child]
+            if child + 1 < size and nodes[child + 1].priority < smaller.priority:
+                child += 1
+                smaller = nodes[child]
+            if not smaller.priority < priority:
+                break
+            nodes[index] = smaller
+            smaller.index = index
+            index = child
+            child = self.__get_left_child_index(index)
+        nodes[index] = handle
+        handle.index = index
+
+    def __handle(self, ref: Union[Handle, Any]) -> Handle:
+        if isinstance(ref, Handle):
+            if ref.index >= len(self.nodes) or self.nodes[ref.index] is not ref:
+                raise KeyError(f'{ref} is not in the heap')
+            return ref
+        try:
+            return self.__handles[ref]
+        except KeyError:
+            raise KeyError(f'{ref!r} is not in the heap') from None
+
+    def __remove_at(self, index: int) -> Handle:
+        """ Move the last node into index and fix it up or down """
+        removed = self.nodes[index]
+        last = self.nodes.pop()
+        if last is not removed:
+            self.nodes[index] = last
+            last.index = index
+            self.__heapify_up(index)
+            self.__heapify_down(last.index)
+        del self.__handles[removed.item]
+        return removed
+
+    def add(self, item: Any, priority: Any) -> Handle:
+        if item in self.__handles:
+            raise ValueError(f'{item!r} is already in the heap, use update()')
+        handle = Handle(item, priority, len(self.nodes))
+        self.nodes.append(handle)
+        self.__handles[item] = handle
+        self.__heapify_up(handle.index)
+        return handle
+
+    def poll(self) -> Optional[Any]:
+        if self.is_empty():
+            print('Empty, not polling')
+            return None
+        return self.__remove_at(0).item
+
+    def is_empty(self) -> bool:
+        return not self.nodes
+
+    def peek(self) -> Optional[Any]:
+        if self.is_empty():
+            return None
+        return self.nodes[0].item
+
+    def priority(self, ref: Union[Handle, Any]) -> Any:
+        return self.__handle(ref).priority
+
+    def decrease_key(self, ref: Union[Handle, Any], priority: Any):
+        """ Lower the priority of an item (by handle or item), in O(log n) """
+        handle = self.__handle(ref)
+        if handle.priority < priority:
+            raise ValueError(f'{priority!r} is greater than {handle.priority!r}')
+        handle.priority = priority
+        self.__heapify_up(handle.index)
+
+    def increase_key(self, ref: Union[Handle, Any], priority: Any):
+        """ Raise the priority of an item (by handle or item), in O(log n) """
+        handle = self.__handle(ref)
+        if priority < handle.priority:
+            raise ValueError(f'{priority!r} is smaller than {handle.priority!r}')
+        handle.priority = priority
+        self.__heapify_down(handle.index)
+
+    def update(self, ref: Union[Handle, Any], priority: Any):
+        """ Change the priority of an item in either direction, in O(log n) """
+        handle = self.__handle(ref)
+        if priority < handle.priority:
+            self.decrease_key(handle, priority)
+        else:
+            self.increase_key(handle, priority)
+
+    def remove(self, ref: Union[Handle, Any]) -> Any:
+        """ Remove an item (by handle or item) from the heap, in O(log n) """
+        return self.__remove_at(self.__handle(ref).index).item
+
+
+if __name__ == '__main__':
+    jobs = IndexedMinHeap()
+    backup = jobs.add('backup', 30)
+    for job, priority in (('deploy', 10), ('report', 20), ('cleanup', 40)):
+        jobs.add(job, priority)
+    jobs.decrease_key(backup, 5)
+    jobs.update('deploy', 50)
+    jobs.remove('report')
+    print(f'polled: {[jobs.poll() for _ in range(len(jobs))]}')
+    # polled: ['backup', 'cleanup', 'deploy']
@@ -0,0 +1,148 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, List, Optional
+
+import operator
+
+from minheap import MinHeap
+
+
+class LeftistNode:
+    __slots__ = ('item', 'key', 'left', 'right', 'rank')
+
+    def __init__(self, item: Any, key: Any):
+        self.item = item
+        self.key = key
+        self.left: Optional[LeftistNode] = None
+        self.right: Optional[LeftistNode] = None
+        # Length of the right spine, down to a missing child
+        self.rank = 1
+
+
+class LeftistHeap:
+    """
+    Meldable heap as a binary tree of nodes, where the right spine of every
+    subtree is no longer than the left one's (the leftist property). The
+    right spine of n nodes is then at most log2(n + 1) long, and two heaps
+    are melded by merging their right spines, like two sorted lists, in
+    O(log n). Children are swapped on the way back up wherever the property
+    broke.
+
+    add() melds with a single node and poll() melds the two subtrees of the
+    root, so every operation is O(log n), including meld(), where two array
+    MinHeaps need their lists concatenated and heapified in O(n).
+
+    key= and reverse= work as in MinHeap, the key of a node is computed once
+    when it is added. to_minheap() converts it into a MinHeap in O(n).
+    """
+
+    def __init__(self, nodes: Optional[Iterable[Any]] = None,
+                 key: Optional[Callable[[Any], Any]] = None,
+                 reverse: bool = False):
+        """
+        Builds the heap in O(n) by melding single nodes in pairs, then the
+        resulting heaps in pairs, and so on, instead of add() once per node.
+        """
+        self.key = key
+        self.reverse = reverse
+        self.__lt = operator.gt if reverse else operator.lt
+        self.__root: Optional[LeftistNode] = None
+        self.__size = 0
+        if nodes is None:
+            return
+        heaps = [LeftistNode(node, node if key is None else key(node)) for node in nodes]
+        self.__size = len(heaps)
+        while len(heaps) > 1:
+            paired = [self.__meld(heaps[index], heaps[index + 1])
+                      for index in range(0, len(heaps) - 1, 2)]
+            if len(heaps) % 2:
+                paired.append(heaps[-1])
+            heaps = paired
+        if heaps:
+            self.__root = heaps[0]
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def is_empty(self) -> bool:
+        return self.__root is None
+
+    def __meld(self, first: Optional[LeftistNode],
+               second: Optional[LeftistNode]) -> Optional[LeftistNode]:
+        """
+        Merges the right spines of two trees. The recursion only follows
+        right spines, so it is at most about 2 log2(n) deep.
+        """
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if self.__lt(second.key, first.key):
+            first, second = second, first
+        first.right = self.__meld(first.right, second)
+        left, right = first.left, first.right
+        if left is None or left.rank < right.rank:
+            first.left, first.right = right, left
+        first.rank = 1 + (first.right.rank if first.right is not None else 0)
+        return first
+
+    def add(self, item: Any):
+        node = LeftistNode(item, item if self.key is None else self.key(item))
+        self.__root = self.__meld(self.__root, node)
+        self.__size += 1
+
+    def peek(self) -> Optional[Any]:
+        if self.__root is None:
+            return None
+        return self.__root.item
+
+    def poll(self) -> Optional[Any]:
+        if self.__root is None:
+            print('Empty, not polling')
+            return None
+        root = self.__root
+        self.__root = self.__meld(root.left, root.right)
+        self.__size -= 1
+        return root.item
+
+    def meld(self, other: LeftistHeap):
+        """ Moves all nodes of other into this heap in O(log n), leaving other empty """
+        if other is self:
+            return
+        if other.key is not self.key or other.reverse != self.reverse:
+            raise ValueError('Cannot meld heaps with a different key or reverse')
+        self.__root = self.__meld(self.__root, other.__root)
+        self.__size += other.__size
+        other.__root = None
+        other.__size = 0
+
+    def to_minheap(self) -> MinHeap:
+        """
+        MinHeap with the same items, key and reverse, built in O(n) with a
+        single heapify, reusing the keys stored in the nodes. This heap is
+        left as is.
+        """
+        items: List[Any] = []
+        keys: List[Any] = []
+        stack = [self.__root] if self.__root is not None else []
+        while stack:
+            node = stack.pop()
+            items.append(node.item)
+            keys.append(node.key)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        return MinHeap(items, copy=False, key=self.key, reverse=self.reverse,
+                       keys=keys if self.key is not None else None)
+
+
+if __name__ == '__main__':
+    tenant_a = LeftistHeap([10, 15, 8])
+    tenant_b = LeftistHeap([20, 17, 3])
+    tenant_a.meld(tenant_b)
+    print(f'melded: {len(tenant_a)}, other: {len(tenant_b)}, min: {tenant_a.peek()}')
+    # melded: 6, other: 0, min: 3
+
+    heap = tenant_a.to_minheap()
+    print(f'polled: {[heap.poll() for _ in range(len(heap))]}')
+    # polled: [3, 8, 10, 15, 17, 20]
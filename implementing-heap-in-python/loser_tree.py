@@ -0,0 +1,121 @@
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+import operator
+
+# Key of an exhausted input, it loses against everything
+_EXHAUSTED = object()
+
+
+class LoserTree:
+    """
+    Tournament tree over k inputs, where each internal node keeps the loser of
+    the match played there and the overall winner is kept in losers[0].
+
+    It uses the same implicit array layout as MinHeap: internal nodes are
+    1..k-1, input i is the leaf k + i, and the parent of node p is p // 2.
+    After the winner is replaced by the next key of its input, only the
+    matches on the path from its leaf to the root are replayed, against the
+    losers stored there: exactly ceil(log2 k) comparisons, where heapify down
+    in a binary heap compares two children at each of its log2 k levels.
+    """
+    keys: List[Any]
+    losers: List[int]
+
+    def __init__(self, keys: List[Any],
+                 lt: Callable[[Any, Any], bool] = operator.lt):
+        self.keys = keys
+        self.__lt = lt
+        size = len(keys)
+        self.losers = [0] * size
+        if size == 0:
+            return
+        winners = [0] * (2 * size)
+        for leaf in range(size):
+            winners[size + leaf] = leaf
+        for node in range(size - 1, 0, -1):
+            left, right = winners[2 * node], winners[2 * node + 1]
+            if self.__beats(right, left):
+                left, right = right, left
+            winners[node], self.losers[node] = left, right
+        self.losers[0] = winners[1] if size > 1 else 0
+
+    def __beats(self, challenger: int, winner: int) -> bool:
+        """ Smaller key wins, ties go to the input that comes first """
+        challenger_key, winner_key = self.keys[challenger], self.keys[winner]
+        if challenger_key is _EXHAUSTED:
+            return False
+        if winner_key is _EXHAUSTED:
+            return True
+        if challenger < winner:
+            return not self.__lt(winner_key, challenger_key)
+        return self.__lt(challenger_key, winner_key)
+
+    def winner(self) -> int:
+        """ Index of the input holding the smallest key """
+        return self.losers[0]
+
+    def replay(self, key: Any):
+        """
+        Replace the key of the winner (or mark it exhausted with _EXHAUSTED)
+        and replay its matches up to the root. Inlines __beats, since this is
+        the loop run once per merged value.
+        """
+        keys, losers, lt = self.keys, self.losers, self.__lt
+        winner = losers[0]
+        keys[winner] = key
+        node = (len(keys) + winner) >> 1
+        while node:
+            challenger = losers[node]
+            challenger_key = keys[challenger]
+            if challenger_key is not _EXHAUSTED and (
+                    key is _EXHAUSTED
+                    or (not lt(key, challenger_key) if challenger < winner
+                        else lt(challenger_key, key))):
+                losers[node] = winner
+                winner, key = challenger, challenger_key
+            node >>= 1
+        losers[0] = winner
+
+
+def merge(*iterables: Iterable[Any], key: Optional[Callable[[Any], Any]] = None,
+          reverse: bool = False) -> Iterator[Any]:
+    """
+    Lazily merges sorted iterables into a single sorted iterator, with the
+    same interface as merge.merge, using a LoserTree instead of a MinHeap.
+    Equal keys come out in input order.
+    """
+    next_values = [iter(iterable).__next__ for iterable in iterables]
+    values: List[Any] = []
+    keys: List[Any] = []
+    for next_value in next_values:
+        try:
+            value = next_value()
+        except StopIteration:
+            value = _EXHAUSTED
+        values.append(value)
+        keys.append(value if key is None or value is _EXHAUSTED else key(value))
+    if not keys:
+        return
+    tree = LoserTree(keys, operator.gt if reverse else operator.lt)
+
+    while True:
+        winner = tree.winner()
+        if keys[winner] is _EXHAUSTED:
+            return
+        yield values[winner]
+        try:
+            value = next_values[winner]()
+        except StopIteration:
+            tree.replay(_EXHAUSTED)
+            continue
+        values[winner] = value
+        tree.replay(value if key is None else key(value))
+
+
+if __name__ == '__main__':
+    print(f'merge: {list(merge([1, 4, 7], [2, 5, 8], [3, 6, 9]))}')
+    print(f'reverse: {list(merge([7, 4, 1], [8, 5], [], reverse=True))}')
+    print(f'key: {list(merge(["a", "ccc"], ["bb", "dddd"], key=len))}')
+    # merge: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    # reverse: [8, 7, 5, 4, 1]
+    # key: ['a', 'bb', 'ccc', 'dddd']
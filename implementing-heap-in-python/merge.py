@@ -0,0 +1,64 @@
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from minheap import MinHeap
+
+
+def merge(*iterables: Iterable[Any], key: Optional[Callable[[Any], Any]] = None,
+          reverse: bool = False) -> Iterator[Any]:
+    """
+    Lazily merges sorted iterables into a single sorted iterator, like
+    heapq.merge. The heap holds one head per input, so memory is O(k) for k
+    inputs regardless of their length, and inputs are only read as the
+    output is consumed.
+
+    Each head is a list [key, order, value, next], where key is the value
+    itself without key=, and order is the index of its input: it breaks ties
+    so equal keys come out in input order, and values and next functions are
+    never compared. After yielding the root, its list is updated in place
+    with the next value of the same input and heapified down with replace().
+    """
+    # In a max-heap (reverse) ties go to the greater order, so flip its sign
+    direction = -1 if reverse else 1
+    heads = []
+    for order, iterable in enumerate(iterables):
+        next_value = iter(iterable).__next__
+        try:
+            value = next_value()
+        except StopIteration:
+            continue
+        heads.append([value if key is None else key(value), order * direction,
+                      value, next_value])
+    heap = MinHeap(heads, copy=False, reverse=reverse)
+
+    while len(heap) > 1:
+        head = heap.peek()
+        yield head[2]
+        try:
+            value = head[3]()
+        except StopIteration:
+            heap.poll()
+            continue
+        head[0] = value if key is None else key(value)
+        head[2] = value
+        heap.replace(head)
+
+    if heap.is_empty():
+        return
+    # A single input left, no need to compare anymore
+    head = heap.poll()
+    yield head[2]
+    next_value = head[3]
+    while True:
+        try:
+            yield next_value()
+        except StopIteration:
+            return
+
+
+if __name__ == '__main__':
+    print(f'merge: {list(merge([1, 4, 7], [2, 5, 8], [3, 6, 9]))}')
+    print(f'reverse: {list(merge([7, 4, 1], [8, 5], [], reverse=True))}')
+    print(f'key: {list(merge(["a", "ccc"], ["bb", "dddd"], key=len))}')
+    # merge: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    # reverse: [8, 7, 5, 4, 1]
+    # key: ['a', 'bb', 'ccc', 'dddd']
@@ -15,27 +15,23 @@ class MinHeap:
     # __get_parent_index
     # ...
 
-    def __swap(self, first_idx: int, second_idx: int):
-        if first_idx >= len(self.nodes) or second_idx >= len(self.nodes):
-            print(f'first ({first_idx}) or second ({second_idx}) are invalid')
-            return
-        tmp = self.nodes[first_idx]
-        self.nodes[first_idx] = self.nodes[second_idx]
-        self.nodes[second_idx] = tmp
-
     def __heapify_up(self, child: Optional[int] = None):
         """Move last added element to correct position in heap"""
-        if not child:
+        if child is None:
             # Start with last
             child = len(self.nodes) - 1
-        # Check if smaller than parent
-        parent_idx = self.__get_parent_index(child)
-        if self.__parent(child) and self.nodes[child] < self.__parent(child):
-            # Swap child <> parent
-            self.__swap(child, parent_idx)
-            # Recurse on parent index now (should have child value)
-            self.__heapify_up(child=parent_idx)
-        # If its not smaller, leave as it is
+        # Take the element out, leaving a "hole" at its position
+        item = self.nodes[child]
+        while self.__has_parent(child):
+            # Check if smaller than parent
+            parent_idx = self.__get_parent_index(child)
+            if not item < self.nodes[parent_idx]:
+                # If its not smaller, leave it in the hole
+                break
+            # Move parent down into the hole, hole goes up
+            self.nodes[child] = self.nodes[parent_idx]
+            child = parent_idx
+        self.nodes[child] = item
         return self.nodes
 
     def add(self, item: int):
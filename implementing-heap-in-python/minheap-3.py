@@ -15,34 +15,30 @@ class MinHeap:
     # __get_parent_index
     # ...
 
-    def __swap(self, first_idx: int, second_idx: int):
-        if first_idx >= len(self.nodes) or second_idx >= len(self.nodes):
-            print(f'first ({first_idx}) or second ({second_idx}) are invalid')
-            return
-        tmp = self.nodes[first_idx]
-        self.nodes[first_idx] = self.nodes[second_idx]
-        self.nodes[second_idx] = tmp
-
     # Commenting out insertion methods: add() and heapify_up()
 
     def __heapify_down(self, index: Optional[int] = 0):
         """Move root to proper position in heap"""
-        if index >= len(self.nodes) or not self.__has_left_child(index):
-            return self.nodes
-        # Check if greater than left or right
-        smaller_child_idx = self.__get_left_child_index(index)
-        if self.__has_right_child(index) and \
-                self.__right_child(index) < self.__left_child(index):
-            smaller_child_idx = self.__get_right_child_index(index)
-
-        if self.nodes[index] < self.nodes[smaller_child_idx]:
-            # Lower than both, do nothing
+        if index >= len(self.nodes):
             return self.nodes
-
-        if self.nodes[index] > self.nodes[smaller_child_idx]:
-            # Swap with smaller child
-            self.__swap(index, smaller_child_idx)
-            return self.__heapify_down(smaller_child_idx)
+        # Take the element out, leaving a "hole" at its position
+        item = self.nodes[index]
+        while self.__has_left_child(index):
+            # Check if greater than left or right
+            smaller_child_idx = self.__get_left_child_index(index)
+            if self.__has_right_child(index) and \
+                    self.__right_child(index) < self.__left_child(index):
+                smaller_child_idx = self.__get_right_child_index(index)
+
+            if not self.nodes[smaller_child_idx] < item:
+                # Lower than both, do nothing
+                break
+
+            # Move smaller child up into the hole, hole goes down
+            self.nodes[index] = self.nodes[smaller_child_idx]
+            index = smaller_child_idx
+        self.nodes[index] = item
+        return self.nodes
 
     def poll(self) -> Optional[int]:
         """
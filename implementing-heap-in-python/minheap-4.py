@@ -13,7 +13,6 @@ class MinHeap:
     # __get_left_child_index
     # __get_right_child_index
     # __get_parent_index
-    # __swap
     # ...
 
     # Commenting out insertion methods: add() and heapify_up()
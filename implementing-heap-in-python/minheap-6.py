@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 
 class MinHeap:
@@ -13,27 +13,30 @@ class MinHeap:
     # __get_left_child_index
     # __get_right_child_index
     # __get_parent_index
-    # __swap
     # ...
 
     # Commenting out insertion methods: add() and heapify_up()
     # Commenting out deletion methods: poll() and heapify_down()
     # Commenting out peek() and is_empty()
 
-    def heapify_children(self, index: int):
+    def heapify_down(self, index: int = 0, size: Optional[int] = None):
         """
-        Heapify children of a node to obey left < right.
+        Same as __heapify_down, but only the first `size` nodes are considered
+        part of the heap. Nodes after them are left untouched.
         """
-        if not self.__has_left_child(index):
-            return
-        if not self.__has_right_child(index):
-            return
-        if self.__right_child(index) < self.__left_child(index):
-            self.__swap(
-                self.__get_right_child_index(index),
-                self.__get_left_child_index(index))
-        self.heapify_children(self.__get_left_child_index(index))
-        self.heapify_children(self.__get_right_child_index(index))
+        if size is None:
+            size = len(self.nodes)
+        item = self.nodes[index]
+        child = 2 * index + 1
+        while child < size:
+            if child + 1 < size and self.nodes[child + 1] < self.nodes[child]:
+                child += 1
+            if not self.nodes[child] < item:
+                break
+            self.nodes[index] = self.nodes[child]
+            index = child
+            child = 2 * index + 1
+        self.nodes[index] = item
 
 
 def heapsort_in_place(unsorted_input: List[int]) -> List[int]:
@@ -42,9 +45,15 @@ def heapsort_in_place(unsorted_input: List[int]) -> List[int]:
     heap.nodes = unsorted_input
     size = len(unsorted_input)
     print(f'identity check: {heap.nodes is unsorted_input}')
-    for idx in range(size // 2, -1, -1):
+    # Build the heap bottom-up, from the last parent to the root
+    for idx in range(size // 2 - 1, -1, -1):
         heap.heapify_down(idx)
-    heap.heapify_children(0)
+    # Sort-down: swap the smallest (root) right after the shrunk heap
+    for end in range(size - 1, 0, -1):
+        heap.nodes[0], heap.nodes[end] = heap.nodes[end], heap.nodes[0]
+        heap.heapify_down(0, size=end)
+    # The min-heap leaves the keys in descending order
+    heap.nodes.reverse()
     return heap.nodes
 
 
@@ -52,4 +61,4 @@ if __name__ == '__main__':
     unsorted_array = [10, 15, 8, 20, 17]
     print(f'heapsort in-place: {heapsort_in_place(unsorted_array)}')
     # identity check: True
-    # heapsort with aux space: [8, 10, 15, 17, 20]
+    # heapsort in-place: [8, 10, 15, 17, 20]
@@ -0,0 +1,474 @@
+from __future__ import annotations
+from array import typecodes
+from collections.abc import MutableSequence
+from typing import Any, Callable, Iterable, List, Optional
+
+import operator
+
+from storage import (NUMPY_HEAPIFY_THRESHOLD, NumpyStorage, numpy_heapify,
+                     storage_copy, typed_storage)
+
+
+class MinHeap:
+    """
+    Abstracting the node data as Int but could be Any, given a key function
+    (like sorted's key=) to guide ourselves on how to compare the nodes.
+
+    The key of each node is computed once, when it is inserted, and stored in
+    `keys` at the same index as the node in `nodes`, so heapify up/down only
+    compare the stored keys. Without key, `keys` is None and the nodes are
+    compared directly, with operator.gt instead of < when reverse=True.
+
+    Each node has up to `arity` children (2 for a binary heap). A larger
+    arity makes the heap shallower, log_d(n) levels, so add() does fewer
+    comparisons and poll() scans a contiguous run of d children per level.
+
+    For pure-numeric heaps, `nodes` can be typed storage instead of a list
+    (see storage.py), e.g. MinHeap(deadlines, typecode='q') keeps the nodes
+    as unboxed int64 in an array.array, exported with buffer(). Heaps larger
+    than RAM can be kept in a memory-mapped file with from_mmap().
+
+    This is the complete version of the snippets in minheap-1.py to
+    minheap-6.py, put together in a single importable module.
+    """
+    nodes: List[int]
+    keys: Optional[List[Any]]
+
+    def __init__(self, nodes: Optional[Iterable[int]] = None, copy: bool = True,
+                 key: Optional[Callable[[Any], Any]] = None,
+                 reverse: bool = False, arity: int = 2,
+                 typecode: Optional[str] = None, heapify: bool = True,
+                 keys: Optional[List[Any]] = None):
+        """
+        Builds the heap from nodes in O(n) with Floyd's bottom-up heapify, the
+        same approach as heapq.heapify, instead of add() once per element.
+
+        With copy=False a list passed in is adopted as the heap storage and
+        rearranged in-place, so the caller should not modify it afterwards.
+        The same goes for typed storage such as array.array or NumpyStorage.
+
+        With typecode ('q', 'd', ...), nodes are copied into an array.array of
+        that type. Note keys are still a list, so key= takes back most of the
+        memory saved; reverse=True alone does not need keys.
+
+        With reverse=True the node with the largest key is polled first,
+        making it a max-heap.
+
+        With heapify=False, nodes must already be in heap order (such as a
+        heap file reopened from disk) and the O(n) heapify is skipped.
+
+        keys can pass the keys already computed for nodes, in the same order
+        (such as from another heap), so key is not called again for them. The
+        list is adopted as is. key is still needed, for the nodes added later.
+        """
+        if arity < 2:
+            raise ValueError(f'arity must be at least 2, got {arity}')
+        if keys is not None and key is None:
+            raise ValueError('keys requires key, to compute the keys of new nodes')
+        if nodes is None:
+            nodes = []
+        if typecode is not None:
+            if copy or getattr(nodes, 'typecode', None) != typecode:
+                nodes = typed_storage(typecode, nodes)
+        elif copy or not isinstance(nodes, MutableSequence):
+            nodes = storage_copy(nodes)
+        self.nodes = nodes
+        self.key = key
+        self.reverse = reverse
+        self.arity = arity
+        self.__lt = operator.gt if reverse else operator.lt
+        self.keys = None
+        if key is not None:
+            if keys is None:
+                keys = [key(node) for node in nodes]
+            elif len(keys) != len(nodes):
+                raise ValueError(f'keys must have one key per node, got '
+                                 f'{len(keys)} for {len(nodes)} nodes')
+            self.keys = keys
+        # Storage that writes back after every operation, see MmapStorage.sync
+        self.__sync = getattr(nodes, 'sync', None)
+        if heapify:
+            self.__heapify()
+
+    @classmethod
+    def from_iterable(cls, nodes: Iterable[int], copy: bool = True,
+                      key: Optional[Callable[[Any], Any]] = None,
+                      reverse: bool = False, arity: int = 2,
+                      typecode: Optional[str] = None) -> MinHeap:
+        """ Same as MinHeap(nodes), accepting any iterable such as generators """
+        return cls(nodes, copy=copy, key=key, reverse=reverse, arity=arity,
+                   typecode=typecode)
+
+    @classmethod
+    def from_numpy(cls, values, copy: bool = True, arity: int = 2,
+                   keep_numpy: bool = False) -> MinHeap:
+        """
+        Builds the heap from a 1-D NumPy array. Large binary heaps are
+        heapified with vectorized compare-and-swap, a level at a time,
+        instead of element by element. With copy=False the array itself is
+        rearranged in-place.
+
+        NumpyStorage reads every node through a Python-level __getitem__,
+        several times slower than array.array, so the heapified values are
+        then copied once into an array.array of the same type, unless
+        keep_numpy=True (to keep sharing the buffer with NumPy code) or the
+        dtype has no array.array typecode.
+        """
+        storage = NumpyStorage(values.dtype.char, values, copy=copy)
+        heap = cls(storage, copy=False, arity=arity)
+        if not keep_numpy and storage.typecode in typecodes:
+            heap.nodes = storage.to_array()
+        return heap
+
+    @classmethod
+    def from_mmap(cls, path: str, record_format: Optional[str] = None,
+                  arity: Optional[int] = None, fsync: str = 'close',
+                  prefetch_pages: int = 0) -> MinHeap:
+        """
+        Opens the heap kept in a memory-mapped file at path, or creates it,
+        see mmap_storage.MmapStorage. The file is in heap order between
+        operations, so reopening it does not rebuild anything. Close it with
+        heap.nodes.close().
+
+        key= and reverse= are not available, since the keys would be held in
+        memory: store records such as (priority, id) with record_format='qq'
+        instead, negating priorities for a max-heap.
+        """
+        from mmap_storage import MmapStorage
+        storage = MmapStorage(path, record_format, arity, fsync, prefetch_pages)
+        return cls(storage, copy=False, arity=storage.arity, heapify=False)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __get_left_child_index(self, parent_index: int) -> int:
+        # First of the `arity` children
+        return self.arity * parent_index + 1
+
+    def __get_right_child_index(self, parent_index: int) -> int:
+        # Last of the `arity` children
+        return self.arity * parent_index + self.arity
+
+    def __get_parent_index(self, child_index: int) -> int:
+        return (child_index - 1) // self.arity
+
+    def __heapify_up(self, child: Optional[int] = None):
+        """
+        Move last added element to correct position in heap.
+
+        Instead of swapping child <> parent at every level, we take the moving
+        element out of the array, leaving a "hole" at its index. Each parent
+        that is greater is shifted down into the hole and the hole moves up.
+        The element is written only once, into the final position of the hole.
+        """
+        nodes = self.nodes
+        if child is None:
+            # Start with last
+            child = len(nodes) - 1
+        if self.keys is not None or self.reverse:
+            return self.__heapify_up_keyed(child)
+        arity = self.arity
+        item = nodes[child]
+        while child > 0:
+            # Same as __get_parent_index, inlined to avoid a call per level
+            parent_idx = (child - 1) // arity
+            parent = nodes[parent_idx]
+            if not item < parent:
+                # If its not smaller, the hole is the right place
+                break
+            # Shift parent down into the hole
+            nodes[child] = parent
+            child = parent_idx
+        nodes[child] = item
+        return nodes
+
+    def __heapify_down(self, index: int = 0):
+        """
+        Move root to proper position in heap.
+
+        Same "hole" idea as __heapify_up: the smaller child is shifted up into
+        the hole until the moving element is not greater than both children.
+        """
+        nodes = self.nodes
+        size = len(nodes)
+        if index >= size:
+            return nodes
+        if self.keys is not None or self.reverse:
+            return self.__heapify_down_keyed(index)
+        if self.arity != 2:
+            return self.__heapify_down_wide(index)
+        item = nodes[index]
+        # Same as __get_left_child_index, inlined to avoid a call per level
+        child = 2 * index + 1
+        while child < size:
+            # Pick the smaller between left and right
+            right = child + 1
+            if right < size and nodes[right] < nodes[child]:
+                child = right
+            if not nodes[child] < item:
+                # Lower than (or equal to) both, do nothing
+                break
+            # Shift smaller child up into the hole
+            nodes[index] = nodes[child]
+            index = child
+            child = 2 * index + 1
+        nodes[index] = item
+        return nodes
+
+    def __heapify_up_keyed(self, child: int):
+        """
+        __heapify_up comparing with self.__lt the stored keys, moving nodes
+        along, or the nodes themselves for a max-heap without key= (keyed is
+        False, and keys only names nodes, so it is not written twice).
+        """
+        nodes, lt, arity = self.nodes, self.__lt, self.arity
+        keys = self.keys
+        keyed = keys is not None
+        if not keyed:
+            keys = nodes
+        item, item_key = nodes[child], keys[child]
+        while child > 0:
+            parent_idx = (child - 1) // arity
+            parent_key = keys[parent_idx]
+            if not lt(item_key, parent_key):
+                break
+            nodes[child] = nodes[parent_idx]
+            if keyed:
+                keys[child] = parent_key
+            child = parent_idx
+        nodes[child] = item
+        if keyed:
+            keys[child] = item_key
+        return nodes
+
+    def __heapify_down_keyed(self, index: int):
+        """ __heapify_down as __heapify_up_keyed, keys or nodes with self.__lt """
+        if self.arity != 2:
+            return self.__heapify_down_wide_keyed(index)
+        nodes, lt = self.nodes, self.__lt
+        keys = self.keys
+        keyed = keys is not None
+        if not keyed:
+            keys = nodes
+        size = len(nodes)
+        item, item_key = nodes[index], keys[index]
+        child = 2 * index + 1
+        while child < size:
+            child_key = keys[child]
+            right = child + 1
+            if right < size and lt(keys[right], child_key):
+                child = right
+                child_key = keys[right]
+            if not lt(child_key, item_key):
+                break
+            nodes[index] = nodes[child]
+            if keyed:
+                keys[index] = child_key
+            index = child
+            child = 2 * index + 1
+        nodes[index] = item
+        if keyed:
+            keys[index] = item_key
+        return nodes
+
+    def __heapify_down_wide(self, index: int):
+        """
+        __heapify_down for arity > 2. The children of a node are contiguous in
+        the array, so the smallest is found with a single min() over a slice.
+        Copying the slice and scanning it twice (min, then index) runs in C,
+        and is faster than a single pass over the children in a Python loop.
+        """
+        nodes, arity = self.nodes, self.arity
+        size = len(nodes)
+        item = nodes[index]
+        child = arity * index + 1
+        while child < size:
+            children = nodes[child:child + arity]
+            smallest = min(children)
+            if not smallest < item:
+                break
+            child += children.index(smallest)
+            nodes[index] = smallest
+            index = child
+            child = arity * index + 1
+        nodes[index] = item
+        return nodes
+
+    def __heapify_down_wide_keyed(self, index: int):
+        """ __heapify_down_wide as __heapify_up_keyed, keys or nodes with self.__lt """
+        nodes, lt, arity = self.nodes, self.__lt, self.arity
+        keys = self.keys
+        keyed = keys is not None
+        if not keyed:
+            keys = nodes
+        first = max if self.reverse else min
+        size = len(nodes)
+        item, item_key = nodes[index], keys[index]
+        child = arity * index + 1
+        while child < size:
+            children_keys = keys[child:child + arity]
+            child_key = first(children_keys)
+            if not lt(child_key, item_key):
+                break
+            child += children_keys.index(child_key)
+            nodes[index] = nodes[child]
+            if keyed:
+                keys[index] = child_key
+            index = child
+            child = arity * index + 1
+        nodes[index] = item
+        if keyed:
+            keys[index] = item_key
+        return nodes
+
+    def __heapify(self):
+        """
+        Heapify down every parent, from the last one up to the root. Leaves
+        (the second half of the array) are already valid heaps of size 1.
+        Most parents are close to the bottom so the total work is O(n).
+
+        Large binary heaps in NumpyStorage are heapified with NumPy instead,
+        one whole level of parents at a time (see storage.numpy_heapify).
+        """
+        if (self.keys is None and not self.reverse and self.arity == 2
+                and isinstance(self.nodes, NumpyStorage)
+                and len(self.nodes) >= NUMPY_HEAPIFY_THRESHOLD):
+            numpy_heapify(self.nodes.to_numpy())
+            return
+        last_parent = self.__get_parent_index(len(self.nodes) - 1)
+        for index in range(last_parent, -1, -1):
+            self.__heapify_down(index)
+
+    def add(self, item: int):
+        self.nodes.append(item)
+        if self.keys is not None:
+            self.keys.append(self.key(item))
+        self.__heapify_up()
+        if self.__sync is not None:
+            self.__sync()
+
+    def poll(self) -> Optional[int]:
+        """
+        Polls lowest element from the heap (usually root). To avoid memory shift
+        of first-element removal, we copy the last element to the first
+        position, shrink the size by 1 and heapify down.
+        """
+        if self.is_empty():
+            print('Empty, not polling')
+            return None
+
+        # Shrink size by 1, keeping the last one added
+        last_node = self.nodes.pop()
+        if self.keys is not None:
+            last_key = self.keys.pop()
+        if self.is_empty():
+            if self.__sync is not None:
+                self.__sync()
+            return last_node
+        # Remove first and insert the last one added as the root
+        removed_node = self.nodes[0]
+        self.nodes[0] = last_node
+        if self.keys is not None:
+            self.keys[0] = last_key
+
+        self.__heapify_down()
+        if self.__sync is not None:
+            self.__sync()
+        return removed_node
+
+    def pushpop(self, item: int) -> int:
+        """
+        Same as add(item) followed by poll(), as heapq.heappushpop. If item is
+        not greater than the root it would be polled right away, so it is
+        returned without touching the heap. Otherwise it takes the place of
+        the root, which is returned, and is heapified down: a single heapify
+        down instead of a full heapify up plus a heapify down.
+        """
+        if self.is_empty():
+            return item
+        if self.keys is None:
+            if not self.__lt(self.nodes[0], item):
+                return item
+        else:
+            item_key = self.key(item)
+            if not self.__lt(self.keys[0], item_key):
+                return item
+            self.keys[0] = item_key
+        removed_node = self.nodes[0]
+        self.nodes[0] = item
+        self.__heapify_down()
+        if self.__sync is not None:
+            self.__sync()
+        return removed_node
+
+    def replace(self, item: int) -> Optional[int]:
+        """
+        Same as poll() followed by add(item), as heapq.heapreplace: item takes
+        the place of the root, which is returned, and is heapified down. The
+        returned node can be greater than item. On an empty heap, item is just
+        added and None is returned.
+        """
+        if self.is_empty():
+            self.add(item)
+            return None
+        removed_node = self.nodes[0]
+        self.nodes[0] = item
+        if self.keys is not None:
+            self.keys[0] = self.key(item)
+        self.__heapify_down()
+        if self.__sync is not None:
+            self.__sync()
+        return removed_node
+
+    def is_empty(self) -> bool:
+        return not self.nodes
+
+    def buffer(self) -> memoryview:
+        """
+        Zero-copy view of typed storage, in heap order. While the view is
+        alive an array.array cannot grow or shrink, so release it before
+        adding or polling.
+        """
+        if hasattr(self.nodes, 'buffer'):
+            return self.nodes.buffer()
+        return memoryview(self.nodes)
+
+    def peek(self) -> Optional[int]:
+        if self.is_empty():
+            return None
+        return self.nodes[0]
+
+
+if __name__ == '__main__':
+    heap = MinHeap([10, 15, 8, 20, 17])
+    print(f'heap: {heap.nodes}')
+    print(f'polled: {[heap.poll() for _ in range(len(heap))]}')
+    # heap: [8, 15, 10, 20, 17]
+    # polled: [8, 10, 15, 17, 20]
+
+    unsorted_array = [100, 230, 44, 1, 74, 12013, 84]
+    heap = MinHeap.from_iterable(unsorted_array, copy=False)
+    print(f'identity check: {heap.nodes is unsorted_array}')
+    print(f'heap: {heap.nodes}')
+    # identity check: True
+    # heap: [1, 74, 44, 230, 100, 12013, 84]
+
+    flights = [{'id': 'AA1', 'start': 3}, {'id': 'BA2', 'start': 2},
+               {'id': 'CA3', 'start': 8}]
+    heap = MinHeap(flights, key=lambda flight: flight['start'], reverse=True)
+    print(f'latest: {heap.poll()["id"]}')
+    # latest: CA3
+
+    heap = MinHeap([10, 15, 8, 20, 17], typecode='q')
+    heap.add(5)
+    print(f'typed: {heap.nodes}, {heap.buffer().nbytes} bytes')
+    # typed: array('q', [5, 15, 8, 20, 17, 10]), 48 bytes
+
+    # Keep the 3 largest, the root is the smallest of them
+    heap = MinHeap([10, 15, 8])
+    for value in (20, 17, 1):
+        heap.pushpop(value)
+    print(f'pushpop top-3: {sorted(heap.nodes)}')
+    print(f'replace: {heap.replace(1)}, root: {heap.peek()}')
+    # pushpop top-3: [15, 17, 20]
+    # replace: 15, root: 1
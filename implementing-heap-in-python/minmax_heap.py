@@ -0,0 +1,197 @@
+from typing import Any, Callable, Iterable, List, Optional
+
+import operator
+
+
+class MinMaxHeap:
+    """
+    Double-ended priority queue over a single array, with the same implicit
+    binary tree as MinHeap: levels alternate between min levels (the root's,
+    0, 2, 4, ...) and max levels. A node on a min level is the smallest of
+    its subtree, and one on a max level the largest, so the minimum is the
+    root and the maximum is one of its two children.
+
+    Heapify up and down work as in MinHeap, comparing with grandparents and
+    grandchildren (the nodes on levels of the same kind) with operator.lt on
+    min levels and operator.gt on max levels. Every operation is O(log n),
+    with one array instead of a min-heap and a max-heap of the same items.
+
+    With capacity, the heap is bounded: adding to a full heap evicts the
+    largest item (which may be the new one), e.g. to keep the cheapest
+    capacity jobs.
+    """
+    nodes: List[Any]
+
+    def __init__(self, nodes: Optional[Iterable[Any]] = None, copy: bool = True,
+                 capacity: Optional[int] = None):
+        """
+        Builds the heap in O(n), heapifying down every parent from the last
+        one, as MinHeap. Beyond capacity, the largest nodes are dropped.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError(f'capacity must be at least 1, got {capacity}')
+        if nodes is None:
+            nodes = []
+        elif copy or not isinstance(nodes, list):
+            nodes = list(nodes)
+        self.nodes = nodes
+        self.capacity = capacity
+        for index in range((len(nodes) - 2) // 2, -1, -1):
+            self.__heapify_down(index)
+        while capacity is not None and len(nodes) > capacity:
+            self.poll_max()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def is_empty(self) -> bool:
+        return not self.nodes
+
+    @staticmethod
+    def __order(index: int) -> Callable[[Any, Any], bool]:
+        """ Comparison that holds between a node at index and its descendants """
+        # Level of index is (index + 1).bit_length() - 1, even levels are min
+        return operator.gt if (index + 1).bit_length() % 2 == 0 else operator.lt
+
+    def __heapify_up(self, child: int):
+        """
+        Move last added element to correct position. It first goes to its
+        parent's level if it is out of order with the parent, then moves up
+        through grandparents, with the "hole" approach of MinHeap.
+        """
+        nodes = self.nodes
+        if child == 0:
+            return
+        item = nodes[child]
+        parent = (child - 1) // 2
+        before = self.__order(child)
+        if before(nodes[parent], item):
+            # e.g. smaller than its max-level parent: it belongs to min levels
+            nodes[child] = nodes[parent]
+            child = parent
+            before = self.__order(child)
+        while child > 2:
+            grandparent = (child - 3) // 4
+            if not before(item, nodes[grandparent]):
+                break
+            nodes[child] = nodes[grandparent]
+            child = grandparent
+        nodes[child] = item
+
+    def __heapify_down(self, index: int):
+        """
+        Move the node at index down to a valid position, picking the first
+        (smallest on min levels, largest on max levels) of its children and
+        grandchildren. After moving down to a grandchild it may be out of
+        order with the parent in between, which is of the other kind.
+
+        A child with children of its own cannot come first (it is after them
+        in its own order), so only the four grandchildren, contiguous in the
+        array, are candidates, found with a single min() or max() over a
+        slice as in MinHeap.__heapify_down_wide, plus a right child without
+        children. Moving to a grandchild keeps the same kind of level.
+        """
+        nodes = self.nodes
+        size = len(nodes)
+        before = self.__order(index)
+        pick = min if before is operator.lt else max
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                return
+            grandchild = 2 * child + 1
+            if grandchild < size:
+                grandchildren = nodes[grandchild:grandchild + 4]
+                value = pick(grandchildren)
+                first = grandchild + grandchildren.index(value)
+                right = child + 1
+                if (grandchild + 2 >= size and right < size
+                        and before(nodes[right], value)):
+                    first, value = right, nodes[right]
+            else:
+                first = child
+                if child + 1 < size and before(nodes[child + 1], nodes[child]):
+                    first = child + 1
+                value = nodes[first]
+            item = nodes[index]
+            if not before(value, item):
+                return
+            nodes[index], nodes[first] = value, item
+            if first <= child + 1:
+                # A child without children: the node is now a leaf
+                return
+            parent = (first - 1) // 2
+            if before(nodes[parent], item):
+                nodes[parent], nodes[first] = item, nodes[parent]
+            index = first
+
+    def __max_index(self) -> int:
+        nodes = self.nodes
+        if len(nodes) < 3:
+            return len(nodes) - 1
+        return 1 if not nodes[1] < nodes[2] else 2
+
+    def __remove_at(self, index: int) -> Any:
+        nodes = self.nodes
+        last = nodes.pop()
+        if index == len(nodes):
+            return last
+        removed = nodes[index]
+        nodes[index] = last
+        self.__heapify_down(index)
+        return removed
+
+    def add(self, item: Any) -> Optional[Any]:
+        """
+        Adds item in O(log n). On a full bounded heap, returns the evicted
+        largest item: the previous maximum, or item itself if it is not
+        smaller than that.
+        """
+        evicted = None
+        if self.capacity is not None and len(self.nodes) >= self.capacity:
+            if not item < self.peek_max():
+                return item
+            evicted = self.poll_max()
+        self.nodes.append(item)
+        self.__heapify_up(len(self.nodes) - 1)
+        return evicted
+
+    def peek_min(self) -> Optional[Any]:
+        if self.is_empty():
+            return None
+        return self.nodes[0]
+
+    def peek_max(self) -> Optional[Any]:
+        if self.is_empty():
+            return None
+        return self.nodes[self.__max_index()]
+
+    def poll_min(self) -> Optional[Any]:
+        if self.is_empty():
+            print('Empty, not polling')
+            return None
+        return self.__remove_at(0)
+
+    def poll_max(self) -> Optional[Any]:
+        if self.is_empty():
+            print('Empty, not polling')
+            return None
+        return self.__remove_at(self.__max_index())
+
+    # Same interface as MinHeap
+    peek = peek_min
+    poll = poll_min
+
+
+if __name__ == '__main__':
+    heap = MinMaxHeap([10, 15, 8, 20, 17, 3])
+    print(f'min: {heap.peek_min()}, max: {heap.peek_max()}')
+    print(f'polled: {heap.poll_min()}, {heap.poll_max()}, {heap.poll_min()}')
+    # min: 3, max: 20
+    # polled: 3, 20, 8
+
+    # Keep the 3 cheapest jobs, evicting the most expensive
+    jobs = MinMaxHeap(capacity=3)
+    evicted = [jobs.add(cost) for cost in (40, 10, 30, 20, 50)]
+    print(f'evicted: {evicted}, kept: {sorted(jobs.nodes)}')
+    # evicted: [None, None, None, 40, 50], kept: [10, 20, 30]
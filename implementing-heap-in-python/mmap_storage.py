@@ -0,0 +1,282 @@
+"""
+Memory-mapped storage for MinHeap, for heaps that grow larger than RAM.
+
+Nodes are fixed-width records (a struct format such as 'q' for an int64
+priority, or 'qQ' for a (priority, id) tuple) in a file mapped with mmap, so
+node i lives at a fixed offset and MinHeap's index arithmetic works as it
+does on a list. Only the pages a heap operation touches are read: the top
+levels, shared by every add/poll, stay in the page cache, while the rest of
+the heap is paged in and out by the OS.
+
+The file starts with a one-page header holding the record format, the arity
+of the heap and the number of records, kept up to date on every add/poll.
+The records between two operations are always in heap order, so reopening
+the file is O(1): map it and read the header, nothing to rebuild. Records
+are stored in native byte order, so files are not portable across
+platforms.
+"""
+from __future__ import annotations
+from collections.abc import MutableSequence
+from typing import Any, Optional, Union
+
+import mmap
+import os
+import struct
+
+# magic, version, arity, record format, number of records
+_HEADER = struct.Struct('<4sBBxx16sQ')
+_SIZE = struct.Struct('<Q')
+_SIZE_OFFSET = _HEADER.size - _SIZE.size
+_MAGIC = b'MMHP'
+_VERSION = 1
+# Records start on the second page, so their pages line up with OS pages
+DATA_OFFSET = mmap.PAGESIZE
+# Single-character native formats that memoryview.cast can read directly,
+# faster than struct
+_CAST_FORMATS = frozenset('bBhHiIlLqQnNfd')
+FSYNC_POLICIES = ('never', 'close', 'always')
+
+
+class MmapStorage(MutableSequence):
+    """
+    File-backed buffer of fixed-width records with the list methods used by
+    MinHeap. The file grows by doubling, so append() is amortized O(1).
+
+    fsync picks when the mapped pages are written back to disk (msync plus
+    fsync), which is what survives an OS crash or power loss:
+    - 'never': leave it to the OS.
+    - 'close': on flush() and close() (the default).
+    - 'always': on sync(), which MinHeap calls at the end of every add/poll,
+      so each completed operation is on disk before it returns. Expensive.
+
+    No policy makes an operation atomic. Heapify up/down move a "hole"
+    through the records and write the moving record only at the end, so if
+    the process is killed or the OS crashes in the middle of an add/poll,
+    the file is left without that record and with a neighbour written
+    twice (the size in the header can also be one off). Use a write-ahead
+    log of the operations on top if that is not acceptable.
+
+    With prefetch_pages > 0, the OS is told that access is random, so it
+    does not read ahead pages a heap walk will not visit, and that the first
+    prefetch_pages pages of records (the top levels of the heap, visited by
+    every operation) will be needed, so they are read in right away.
+    """
+    path: str
+    record_format: str
+    arity: int
+
+    def __init__(self, path: str, record_format: Optional[str] = None,
+                 arity: Optional[int] = None, fsync: str = 'close',
+                 prefetch_pages: int = 0):
+        """
+        Opens the heap file at path, or creates it if it does not exist or is
+        empty. record_format and arity default to 'q' and 2 for a new file;
+        for an existing file they default to the stored ones, and raise
+        ValueError if they differ from them.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f'fsync must be one of {FSYNC_POLICIES}, got {fsync!r}')
+        self.path = path
+        self.fsync = fsync
+        self.prefetch_pages = prefetch_pages
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.__file = open(path, 'r+b' if exists else 'w+b')
+        try:
+            if exists:
+                header = self.__file.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    raise ValueError(f'{path} is not a heap file')
+                magic, version, stored_arity, stored_format, size = \
+                    _HEADER.unpack(header)
+                if magic != _MAGIC or version != _VERSION:
+                    raise ValueError(f'{path} is not a heap file')
+                stored_format = stored_format.rstrip(b'\0').decode('ascii')
+                for name, given, stored in (('record_format', record_format, stored_format),
+                                            ('arity', arity, stored_arity)):
+                    if given is not None and given != stored:
+                        raise ValueError(f'{path} has {name} {stored!r}, got {given!r}')
+                record_format, arity = stored_format, stored_arity
+            else:
+                record_format = record_format or 'q'
+                arity = arity or 2
+                size = 0
+                encoded = record_format.encode('ascii')
+                if len(encoded) > 16:
+                    raise ValueError(f'record_format too long: {record_format!r}')
+                self.__file.write(_HEADER.pack(_MAGIC, _VERSION, arity, encoded, 0))
+            self.record_format = record_format
+            self.arity = arity
+            self.__record = struct.Struct(record_format)
+            # Single-field records are plain values, not 1-tuples
+            self.__single = len(self.__record.unpack(bytes(self.__record.size))) == 1
+            # '@' is the native mode, same as no prefix
+            code = record_format[1:] if record_format[:1] == '@' else record_format
+            self.__cast = code if len(code) == 1 and code in _CAST_FORMATS else None
+            self.__size = size
+            capacity = (os.path.getsize(path) - DATA_OFFSET) // self.__record.size
+            self.__map = None
+            self.__view = None
+            self.__remap(max(capacity, size, mmap.PAGESIZE // self.__record.size))
+        except BaseException:
+            self.__file.close()
+            raise
+
+    def __remap(self, capacity: int):
+        """ (Re)maps the file, resized to hold capacity records """
+        self.__release()
+        self.__file.truncate(DATA_OFFSET + capacity * self.__record.size)
+        self.__map = mmap.mmap(self.__file.fileno(), 0)
+        self.__capacity = capacity
+        if self.__cast is not None:
+            self.__view = memoryview(self.__map)[DATA_OFFSET:].cast(self.__cast)
+        if self.prefetch_pages and hasattr(mmap, 'MADV_WILLNEED'):
+            self.__map.madvise(mmap.MADV_RANDOM)
+            length = min(len(self.__map),
+                         DATA_OFFSET + self.prefetch_pages * mmap.PAGESIZE)
+            self.__map.madvise(mmap.MADV_WILLNEED, 0, length)
+
+    def __release(self):
+        if self.__view is not None:
+            self.__view.release()
+            self.__view = None
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __index(self, index: int) -> int:
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError(f'Index {index} out of range')
+        return index
+
+    def __read(self, index: int) -> Any:
+        if self.__view is not None:
+            return self.__view[index]
+        values = self.__record.unpack_from(
+            self.__map, DATA_OFFSET + index * self.__record.size)
+        return values[0] if self.__single else values
+
+    def __write(self, index: int, value: Any):
+        if self.__view is not None:
+            self.__view[index] = value
+            return
+        offset = DATA_OFFSET + index * self.__record.size
+        if self.__single:
+            self.__record.pack_into(self.__map, offset, value)
+        else:
+            self.__record.pack_into(self.__map, offset, *value)
+
+    def __resize(self, size: int):
+        self.__size = size
+        _SIZE.pack_into(self.__map, _SIZE_OFFSET, size)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            if self.__view is not None:
+                return self.__view[:self.__size][index].tolist()
+            return [self.__read(i) for i in range(*index.indices(self.__size))]
+        return self.__read(self.__index(index))
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        if isinstance(index, slice):
+            indices = range(*index.indices(self.__size))
+            value = list(value)
+            if len(value) != len(indices):
+                raise ValueError('MmapStorage cannot resize on slice assignment')
+            for i, item in zip(indices, value):
+                self.__write(i, item)
+            return
+        self.__write(self.__index(index), value)
+
+    def __delitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(self.__size)), reverse=True):
+                del self[i]
+            return
+        index = self.__index(index)
+        record_size = self.__record.size
+        start = DATA_OFFSET + index * record_size
+        self.__map.move(start, start + record_size,
+                        (self.__size - index - 1) * record_size)
+        self.__resize(self.__size - 1)
+
+    def insert(self, index: int, value: Any):
+        if self.__size == self.__capacity:
+            self.__remap(2 * self.__capacity)
+        index = min(max(index + self.__size if index < 0 else index, 0),
+                    self.__size)
+        record_size = self.__record.size
+        start = DATA_OFFSET + index * record_size
+        self.__map.move(start + record_size, start,
+                        (self.__size - index) * record_size)
+        self.__write(index, value)
+        self.__resize(self.__size + 1)
+
+    def append(self, value: Any):
+        if self.__size == self.__capacity:
+            self.__remap(2 * self.__capacity)
+        self.__write(self.__size, value)
+        self.__resize(self.__size + 1)
+
+    def pop(self, index: int = -1) -> Any:
+        if index != -1 and index != self.__size - 1:
+            value = self[index]
+            del self[index]
+            return value
+        if not self.__size:
+            raise IndexError('pop from empty storage')
+        value = self.__read(self.__size - 1)
+        self.__resize(self.__size - 1)
+        return value
+
+    def flush(self):
+        """ Writes the mapped pages and the file size back to disk """
+        self.__map.flush()
+        os.fsync(self.__file.fileno())
+
+    def sync(self):
+        """ Flushes with fsync='always', called after every add/poll of the heap """
+        if self.fsync == 'always':
+            self.flush()
+
+    def close(self):
+        if self.__file.closed:
+            return
+        if self.fsync != 'never':
+            self.flush()
+        self.__release()
+        self.__file.close()
+
+    def __enter__(self) -> MmapStorage:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f'MmapStorage({self.path!r}, {self.record_format!r}, '
+                f'arity={self.arity}, size={self.__size})')
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    from minheap import MinHeap
+
+    path = os.path.join(tempfile.mkdtemp(), 'jobs.heap')
+    heap = MinHeap.from_mmap(path, record_format='qq')
+    for job_id, priority in enumerate((30, 10, 20, 50, 40)):
+        heap.add((priority, job_id))
+    print(f'polled: {heap.poll()}, stored: {heap.nodes}')
+    heap.nodes.close()
+    # polled: (10, 1), stored: MmapStorage('.../jobs.heap', 'qq', arity=2, size=4)
+
+    # After a restart, the heap is mapped back as it was
+    heap = MinHeap.from_mmap(path)
+    print(f'reopened: {[heap.poll() for _ in range(len(heap))]}')
+    heap.nodes.close()
+    # reopened: [(20, 2), (30, 0), (40, 4), (50, 3)]
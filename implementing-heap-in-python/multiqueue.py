@@ -0,0 +1,94 @@
+from typing import Any, Callable, List, Optional
+
+import operator
+import os
+import random
+import threading
+
+from minheap import MinHeap
+
+
+class MultiQueue:
+    """
+    Relaxed concurrent priority queue: c * threads independent MinHeaps, each
+    behind its own lock, instead of a single heap behind one lock that every
+    worker contends on.
+
+    add() puts the item in a random heap. poll() looks at the roots of two
+    random heaps and polls the smaller one. If the chosen lock is busy, the
+    operation retries with other random heaps instead of waiting, so workers
+    rarely block each other. Items come out in approximate priority order:
+    the rank error (how many smaller items were in the queue when an item was
+    polled) is O(c * threads) on average, see bench_multiqueue.py.
+    """
+    heaps: List[MinHeap]
+
+    def __init__(self, threads: Optional[int] = None, c: int = 2,
+                 key: Optional[Callable[[Any], Any]] = None,
+                 reverse: bool = False):
+        count = max(2, c * (threads or os.cpu_count() or 1))
+        self.heaps = [MinHeap(key=key, reverse=reverse) for _ in range(count)]
+        self.__locks = [threading.Lock() for _ in range(count)]
+        self.__lt = operator.gt if reverse else operator.lt
+
+    def __len__(self) -> int:
+        """ Approximate while other threads are adding or polling """
+        return sum(len(heap) for heap in self.heaps)
+
+    def is_empty(self) -> bool:
+        return all(heap.is_empty() for heap in self.heaps)
+
+    def __root_key(self, index: int) -> Any:
+        """
+        Key of the root of a heap, read without its lock: it may be stale by
+        the time the heap is locked, which only makes the choice less exact.
+        Returns None for an empty heap.
+        """
+        heap = self.heaps[index]
+        try:
+            return heap.nodes[0] if heap.keys is None else heap.keys[0]
+        except IndexError:
+            return None
+
+    def add(self, item: Any):
+        heaps, locks = self.heaps, self.__locks
+        while True:
+            index = random.randrange(len(heaps))
+            if locks[index].acquire(blocking=False):
+                try:
+                    heaps[index].add(item)
+                    return
+                finally:
+                    locks[index].release()
+
+    def poll(self) -> Optional[Any]:
+        """ Polls a small item, or returns None once every heap is empty """
+        heaps, locks = self.heaps, self.__locks
+        while True:
+            first = random.randrange(len(heaps))
+            second = random.randrange(len(heaps))
+            first_key, second_key = self.__root_key(first), self.__root_key(second)
+            if first_key is None and second_key is None:
+                if self.is_empty():
+                    return None
+                continue
+            if first_key is None or (second_key is not None
+                                     and self.__lt(second_key, first_key)):
+                first = second
+            if not locks[first].acquire(blocking=False):
+                continue
+            try:
+                if not heaps[first].is_empty():
+                    return heaps[first].poll()
+            finally:
+                locks[first].release()
+
+
+if __name__ == '__main__':
+    queue = MultiQueue(threads=2)
+    for value in range(100):
+        queue.add(value)
+    polled = [queue.poll() for _ in range(len(queue))]
+    print(f'polled all: {sorted(polled) == list(range(100))}, '
+          f'then: {queue.poll()}')
+    # polled all: True, then: None
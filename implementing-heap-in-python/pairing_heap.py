@@ -0,0 +1,161 @@
+from __future__ import annotations
+from typing import Any, List, Optional
+
+
+class PairingNode:
+    """
+    Node of a PairingHeap, returned by add() as a handle for decrease_key().
+    Children of a node are a linked list starting at child and following
+    sibling; prev points to the left sibling, or to the parent for the first
+    child, so a node can be cut out of its list in O(1).
+    """
+    __slots__ = ('item', 'priority', 'child', 'sibling', 'prev', 'polled')
+
+    def __init__(self, item: Any, priority: Any):
+        self.item = item
+        self.priority = priority
+        self.child: Optional[PairingNode] = None
+        self.sibling: Optional[PairingNode] = None
+        self.prev: Optional[PairingNode] = None
+        self.polled = False
+
+    def __repr__(self) -> str:
+        return f'PairingNode({self.item!r}, priority={self.priority!r})'
+
+
+class PairingHeap:
+    """
+    Heap-ordered multiway tree, instead of MinHeap's implicit array: the
+    root is the smallest node, and two heaps are joined (linked) in O(1) by
+    making the root with the greater priority the first child of the other.
+
+    - add() and meld() link with the root, O(1).
+    - decrease_key() cuts the node (and its subtree) out of its parent and
+      links it with the root, O(1) amortized in practice (o(log n) proven),
+      where MinHeap would heapify up in O(log n).
+    - poll() removes the root and links its children in two passes: pairs
+      left to right, then the pairs right to left into one tree. O(log n)
+      amortized.
+
+    Priorities default to the items themselves, so it can be used as
+    MinHeap with add(item) / poll() / peek().
+    """
+
+    def __init__(self):
+        self.__root: Optional[PairingNode] = None
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def is_empty(self) -> bool:
+        return self.__root is None
+
+    @staticmethod
+    def __link(first: PairingNode, second: PairingNode) -> PairingNode:
+        """ Links two roots, the greater becomes the first child of the other """
+        if second.priority < first.priority:
+            first, second = second, first
+        child = first.child
+        second.sibling = child
+        if child is not None:
+            child.prev = second
+        second.prev = first
+        first.child = second
+        return first
+
+    def add(self, item: Any, priority: Any = None) -> PairingNode:
+        node = PairingNode(item, item if priority is None else priority)
+        self.__root = node if self.__root is None else self.__link(self.__root, node)
+        self.__size += 1
+        return node
+
+    def peek(self) -> Optional[Any]:
+        if self.__root is None:
+            return None
+        return self.__root.item
+
+    def poll(self) -> Optional[Any]:
+        if self.__root is None:
+            print('Empty, not polling')
+            return None
+        root = self.__root
+        self.__root = self.__merge_pairs(root.child)
+        root.child = None
+        root.polled = True
+        self.__size -= 1
+        return root.item
+
+    def __merge_pairs(self, first: Optional[PairingNode]) -> Optional[PairingNode]:
+        """
+        Two-pass pairing of a list of siblings, iterative to not hit the
+        recursion limit on long child lists.
+        """
+        link = self.__link
+        pairs: List[PairingNode] = []
+        while first is not None:
+            second = first.sibling
+            first.prev = first.sibling = None
+            if second is None:
+                pairs.append(first)
+                break
+            following = second.sibling
+            second.prev = second.sibling = None
+            pairs.append(link(first, second))
+            first = following
+        if not pairs:
+            return None
+        root = pairs.pop()
+        while pairs:
+            root = link(pairs.pop(), root)
+        root.prev = None
+        return root
+
+    def decrease_key(self, node: PairingNode, priority: Any):
+        """ Lower the priority of a node, by cutting it and linking it to the root """
+        if node.polled:
+            raise KeyError(f'{node} is not in the heap')
+        if node.priority < priority:
+            raise ValueError(f'{priority!r} is greater than {node.priority!r}')
+        node.priority = priority
+        if node is self.__root:
+            return
+        prev = node.prev
+        if prev.child is node:
+            prev.child = node.sibling
+        else:
+            prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = prev
+        node.prev = node.sibling = None
+        self.__root = self.__link(self.__root, node)
+
+    def meld(self, other: PairingHeap):
+        """ Moves all nodes of other into this heap in O(1), leaving other empty """
+        if other is self or other.__root is None:
+            return
+        if self.__root is None:
+            self.__root = other.__root
+        else:
+            self.__root = self.__link(self.__root, other.__root)
+        self.__size += other.__size
+        other.__root = None
+        other.__size = 0
+
+
+if __name__ == '__main__':
+    routes = PairingHeap()
+    nodes = {city: routes.add(city, distance)
+             for city, distance in (('A', 7), ('B', 3), ('C', 9), ('D', 5))}
+    routes.decrease_key(nodes['C'], 1)
+    other = PairingHeap()
+    other.add('E', 4)
+    routes.meld(other)
+    print(f'polled: {[routes.poll() for _ in range(len(routes))]}')
+    # polled: ['C', 'B', 'E', 'D', 'A']
+
+    heap = PairingHeap()
+    for value in (10, 15, 8, 20, 17):
+        heap.add(value)
+    print(f'plain: {[heap.poll() for _ in range(len(heap))]}')
+    # plain: [8, 10, 15, 17, 20]
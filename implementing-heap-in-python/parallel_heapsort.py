@@ -0,0 +1,112 @@
+"""
+Heapsort spread over a process pool: the input is split into one chunk per
+worker, every worker heap-sorts its chunk with heapsort.heapsort, and the
+sorted chunks are k-way merged with merge.merge, on MinHeap.
+
+Numeric input (array.array, or a list with typecode=) is copied once into a
+multiprocessing.shared_memory block, and each worker sorts its slice of that
+block in-place, so no chunk is pickled on the way in or out. Other input is
+sent to the workers as pickled list chunks.
+"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional, Union
+
+import os
+
+from heapsort import heapsort
+from merge import merge
+
+# Below this many items per worker, process startup and merging cost more
+# than sorting everything in the current process
+MIN_CHUNK_SIZE = 10_000
+
+
+def _sort_chunk(chunk: List[Any], key: Optional[Callable[[Any], Any]],
+                reverse: bool) -> List[Any]:
+    return heapsort(chunk, key=key, reverse=reverse)
+
+
+def _sort_shared(name: str, typecode: str, lo: int, hi: int,
+                 key: Optional[Callable[[Any], Any]], reverse: bool):
+    # Workers share the parent's resource tracker, which unlinks the block
+    # once the parent is done with it
+    block = shared_memory.SharedMemory(name=name)
+    view = block.buf.cast(typecode)
+    try:
+        heapsort(view, lo, hi, key=key, reverse=reverse)
+    finally:
+        view.release()
+        block.close()
+
+
+def _bounds(size: int, chunks: int) -> List[tuple]:
+    step, extra = divmod(size, chunks)
+    bounds, lo = [], 0
+    for chunk in range(chunks):
+        hi = lo + step + (1 if chunk < extra else 0)
+        bounds.append((lo, hi))
+        lo = hi
+    return bounds
+
+
+def parallel_heapsort(data: Union[List[Any], array], workers: Optional[int] = None,
+                      key: Optional[Callable[[Any], Any]] = None,
+                      reverse: bool = False,
+                      typecode: Optional[str] = None) -> Union[List[Any], array]:
+    """
+    Returns a sorted copy of data: an array of the same typecode for numeric
+    input, a list otherwise. With typecode ('q', 'd', ...) a list of numbers
+    is handled as numeric input. key must be picklable, e.g. a top-level
+    function, since it is sent to the workers.
+    """
+    workers = workers or os.cpu_count() or 1
+    if typecode is None and isinstance(data, array):
+        typecode = data.typecode
+    chunks = max(1, min(workers, len(data) // MIN_CHUNK_SIZE))
+
+    if chunks == 1:
+        if typecode is not None:
+            return heapsort(array(typecode, data), key=key, reverse=reverse)
+        return heapsort(list(data), key=key, reverse=reverse)
+
+    bounds = _bounds(len(data), chunks)
+    with ProcessPoolExecutor(max_workers=chunks) as pool:
+        if typecode is None:
+            futures = [pool.submit(_sort_chunk, data[lo:hi], key, reverse)
+                       for lo, hi in bounds]
+            return list(merge(*(future.result() for future in futures),
+                              key=key, reverse=reverse))
+
+        values = data
+        if not isinstance(data, array) or data.typecode != typecode:
+            values = array(typecode, data)
+        block = shared_memory.SharedMemory(create=True,
+                                           size=values.itemsize * len(values))
+        view = block.buf.cast(typecode)
+        try:
+            view[:] = values
+            futures = [pool.submit(_sort_shared, block.name, typecode, lo, hi,
+                                   key, reverse)
+                       for lo, hi in bounds]
+            for future in futures:
+                future.result()
+            # Each sorted chunk is merged straight from the shared block
+            return array(typecode, merge(*(view[lo:hi] for lo, hi in bounds),
+                                         key=key, reverse=reverse))
+        finally:
+            view.release()
+            block.close()
+            block.unlink()
+
+
+if __name__ == '__main__':
+    import random
+
+    values = [random.randint(0, 10**6) for _ in range(100_000)]
+    print(f'list: {parallel_heapsort(values, workers=4) == sorted(values)}')
+    print(f'shared memory: '
+          f'{parallel_heapsort(array("q", values), workers=4).tolist() == sorted(values)}')
+    # list: True
+    # shared memory: True
@@ -0,0 +1,101 @@
+from typing import Any, List, Optional, Tuple
+
+from operator import itemgetter
+
+_priority = itemgetter(0)
+
+
+class RadixHeap:
+    """
+    Priority queue for monotone non-negative integer priorities: every
+    priority added must be at least the last polled one, as with the event
+    times of a simulation or the distances of Dijkstra with integer weights.
+
+    Entries go to the bucket numbered by the bit length of
+    priority XOR last, where last is the last polled priority: bucket 0
+    holds priorities equal to last, and bucket b those that first differ
+    from last at bit b - 1. No entries are compared on add(). When bucket 0
+    is empty, poll() takes the first non-empty bucket, makes its smallest
+    priority the new last, and redistributes the bucket: every entry lands
+    in a lower bucket, so each entry moves at most log2(C) times for
+    priorities up to C, and poll() is amortized O(log C).
+
+    A bitmask of non-empty buckets finds the first one in O(1), and buckets
+    are added as needed for larger priorities.
+    """
+
+    def __init__(self):
+        self.__buckets: List[List[Tuple[int, Any]]] = [[] for _ in range(65)]
+        self.__nonempty = 0
+        self.__last = 0
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def is_empty(self) -> bool:
+        return not self.__size
+
+    def add(self, item: Any, priority: Optional[int] = None):
+        """ Adds item, with the item itself as priority by default """
+        if priority is None:
+            priority = item
+        if priority < self.__last:
+            raise ValueError(f'{priority!r} is smaller than the last polled '
+                             f'priority {self.__last!r}')
+        bucket = (priority ^ self.__last).bit_length()
+        buckets = self.__buckets
+        while bucket >= len(buckets):
+            buckets.append([])
+        buckets[bucket].append((priority, item))
+        self.__nonempty |= 1 << bucket
+        self.__size += 1
+
+    def __redistribute(self) -> List[Tuple[int, Any]]:
+        """
+        Refills bucket 0 from the first non-empty bucket when it is empty,
+        and returns it. Its last entry is the next one polled.
+        """
+        buckets = self.__buckets
+        if not buckets[0]:
+            nonempty = self.__nonempty
+            index = (nonempty & -nonempty).bit_length() - 1
+            bucket = buckets[index]
+            buckets[index] = []
+            nonempty ^= 1 << index
+            last = self.__last = min(bucket, key=_priority)[0]
+            for entry in bucket:
+                target = (entry[0] ^ last).bit_length()
+                buckets[target].append(entry)
+                nonempty |= 1 << target
+            self.__nonempty = nonempty
+        return buckets[0]
+
+    def peek(self) -> Optional[Any]:
+        """ Item poll() returns next, redistributing its bucket if needed """
+        if not self.__size:
+            return None
+        return self.__redistribute()[-1][1]
+
+    def poll(self) -> Optional[Any]:
+        if not self.__size:
+            print('Empty, not polling')
+            return None
+        lowest = self.__redistribute()
+        item = lowest.pop()[1]
+        if not lowest:
+            self.__nonempty &= ~1
+        self.__size -= 1
+        return item
+
+
+if __name__ == '__main__':
+    events = RadixHeap()
+    for time, event in ((30, 'flush'), (10, 'tick'), (20, 'retry')):
+        events.add(event, time)
+    print(f'first: {events.poll()}')
+    # Later events are scheduled relative to the current time, 10
+    events.add('tick', 10 + 15)
+    print(f'then: {[events.poll() for _ in range(len(events))]}')
+    # first: tick
+    # then: ['retry', 'tick', 'flush']
@@ -0,0 +1,196 @@
+"""
+Typed storage backends for MinHeap with pure-numeric nodes.
+
+A list of ints keeps one pointer per node plus a boxed int object somewhere
+else in memory (about 36 bytes per node on 64-bit CPython). Storing the raw
+values in a typed buffer takes 8 bytes per node for 'q' (int64) or 'd'
+(float64) and keeps them contiguous, and the buffer can be exported through
+the buffer protocol without copying.
+"""
+from __future__ import annotations
+from array import array
+from collections.abc import MutableSequence
+from typing import Any, Iterable, List, Union
+
+# NumPy is optional, array.array is always available. It takes tens of
+# milliseconds to import, so it is only loaded by the first NumpyStorage
+np = None
+
+
+def _numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('NumpyStorage requires numpy to be installed') from None
+        np = numpy
+    return np
+
+
+class NumpyStorage(MutableSequence):
+    """
+    Growable NumPy buffer with the list methods used by MinHeap. Capacity
+    doubles when full, so append() is amortized O(1) like list.append().
+    Values are read back as Python ints/floats, but every read goes through
+    a Python-level __getitem__, so heap operations are several times slower
+    than on array.array (see bench_storage.py). It is meant for sharing the
+    buffer with NumPy code, and for numpy_heapify.
+    """
+
+    def __init__(self, typecode: str, values: Iterable[Any] = (),
+                 copy: bool = True):
+        """
+        With copy=False, a 1-D NumPy array of the same type is adopted as the
+        buffer without copying it (it is only copied once it has to grow).
+        """
+        _numpy()
+        self.typecode = typecode
+        initial = np.asarray(
+            values if hasattr(values, '__len__') else list(values),
+            dtype=np.dtype(typecode))
+        self.__size = len(initial)
+        if not copy and initial.ndim == 1 and initial.flags.c_contiguous:
+            self.__array = initial
+            return
+        self.__array = np.empty(max(self.__size, 16), dtype=initial.dtype)
+        self.__array[:self.__size] = initial
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __index(self, index: int) -> int:
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError(f'Index {index} out of range')
+        return index
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self.__array[:self.__size][index].tolist()
+        return self.__array[self.__index(index)].item()
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        if isinstance(index, slice):
+            self.__array[:self.__size][index] = value
+            return
+        self.__array[self.__index(index)] = value
+
+    def __delitem__(self, index: Union[int, slice]):
+        keep = np.delete(self.__array[:self.__size], index)
+        self.__size = len(keep)
+        self.__array[:self.__size] = keep
+
+    def __grow(self, capacity: int):
+        capacity = max(capacity, 16)
+        grown = np.empty(capacity, dtype=self.__array.dtype)
+        grown[:self.__size] = self.__array[:self.__size]
+        self.__array = grown
+
+    def insert(self, index: int, value: Any):
+        if self.__size == len(self.__array):
+            self.__grow(2 * len(self.__array))
+        index = min(max(index + self.__size if index < 0 else index, 0),
+                    self.__size)
+        self.__array[index + 1:self.__size + 1] = self.__array[index:self.__size]
+        self.__array[index] = value
+        self.__size += 1
+
+    def append(self, value: Any):
+        if self.__size == len(self.__array):
+            self.__grow(2 * len(self.__array))
+        self.__array[self.__size] = value
+        self.__size += 1
+
+    def pop(self, index: int = -1) -> Any:
+        if index != -1 and index != self.__size - 1:
+            value = self[index]
+            del self[index]
+            return value
+        if not self.__size:
+            raise IndexError('pop from empty storage')
+        self.__size -= 1
+        return self.__array[self.__size].item()
+
+    def copy(self) -> NumpyStorage:
+        return NumpyStorage(self.typecode, self.__array[:self.__size])
+
+    def to_array(self) -> array:
+        """ array.array copy of the stored values, with the same typecode """
+        values = array(self.typecode)
+        values.frombytes(memoryview(self.__array[:self.__size]).cast('B'))
+        return values
+
+    def to_numpy(self):
+        """ Zero-copy NumPy view of the stored values """
+        return self.__array[:self.__size]
+
+    def buffer(self) -> memoryview:
+        """ Zero-copy memoryview of the stored values """
+        return memoryview(self.__array[:self.__size])
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # Buffer protocol for Python classes, available on Python 3.12+
+        return self.buffer()
+
+    def __repr__(self) -> str:
+        return f'NumpyStorage({self.typecode!r}, {self.__array[:self.__size].tolist()})'
+
+
+# Below this size the per-call overhead of NumPy is larger than the cost of
+# heapifying element by element, so MinHeap keeps the scalar path
+NUMPY_HEAPIFY_THRESHOLD = 4096
+
+
+def numpy_heapify(values) -> None:
+    """
+    Floyd's bottom-up heapify of a 1-D NumPy array into a binary min-heap,
+    in-place, vectorized level by level.
+
+    The parents on a level are roots of disjoint subtrees, so all of them can
+    be heapified down at the same time: each step picks the smaller child of
+    every active parent, swaps where the child is smaller, and continues
+    only with the swapped ones, one level further down.
+    """
+    np = _numpy()
+    size = len(values)
+    if size < 2:
+        return
+    last_parent = (size - 2) // 2
+    for level in range((last_parent + 1).bit_length() - 1, -1, -1):
+        first = 2 ** level - 1
+        positions = np.arange(first, min(2 * first + 1, last_parent + 1))
+        while positions.size:
+            left = 2 * positions + 1
+            has_left = left < size
+            positions, left = positions[has_left], left[has_left]
+            # Without a right child, compare the left child with itself
+            right = np.where(left + 1 < size, left + 1, left)
+            child = np.where(values[right] < values[left], right, left)
+            smaller = values[child] < values[positions]
+            positions, child = positions[smaller], child[smaller]
+            parents = values[positions]
+            values[positions] = values[child]
+            values[child] = parents
+            positions = child
+
+
+def typed_storage(typecode: str, values: Iterable[Any] = (),
+                  use_numpy: bool = False) -> Union[array, NumpyStorage]:
+    """
+    Creates typed storage for MinHeap nodes, holding the values unboxed:
+    array.array by default, or a NumpyStorage buffer with use_numpy=True.
+    """
+    if use_numpy:
+        return NumpyStorage(typecode, values)
+    return array(typecode, values)
+
+
+def storage_copy(nodes: Iterable[Any]) -> Union[List[Any], array, NumpyStorage]:
+    """ Copy of nodes keeping its storage type, used by MinHeap(copy=True) """
+    if isinstance(nodes, array):
+        return array(nodes.typecode, nodes)
+    if isinstance(nodes, NumpyStorage):
+        return nodes.copy()
+    return list(nodes)
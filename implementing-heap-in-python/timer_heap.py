@@ -0,0 +1,146 @@
+from __future__ import annotations
+from typing import Any, List, Optional
+
+import itertools
+
+from minheap import MinHeap
+
+# Heaps smaller than this are not worth rebuilding, tombstones are skipped
+MIN_COMPACTION_SIZE = 64
+
+
+class Timer:
+    """
+    Handle of a timer in a TimerHeap, returned by add(). active is True until
+    the timer is polled or cancelled.
+    """
+    __slots__ = ('deadline', 'item', 'active')
+
+    def __init__(self, deadline: Any, item: Any):
+        self.deadline = deadline
+        self.item = item
+        self.active = True
+
+    def __repr__(self) -> str:
+        state = 'active' if self.active else 'inactive'
+        return f'Timer({self.deadline!r}, {self.item!r}, {state})'
+
+
+class TimerHeap:
+    """
+    Heap of deadlines where timers can be cancelled in O(1), for timer queues
+    where most timers are cancelled before they fire (timeouts, retries).
+
+    cancel() only marks the timer inactive, leaving a tombstone in the heap
+    instead of finding and removing it. poll() and peek() drop tombstones
+    when they reach the root. Tombstones deep in the heap would otherwise
+    linger until their deadline, so once they are more than
+    compaction_ratio of the heap (and the heap has at least
+    MIN_COMPACTION_SIZE nodes), the heap is rebuilt from the active timers
+    with an O(n) heapify. Rebuilding after at least ratio * n cancels keeps
+    cancel() amortized O(1), and the heap at most 1 / (1 - ratio) times the
+    number of active timers. compaction_ratio=None never compacts.
+
+    Nodes are [deadline, sequence, timer], so timers with the same deadline
+    fire in the order they were added, and timers are never compared.
+    """
+
+    def __init__(self, compaction_ratio: Optional[float] = 0.5):
+        if compaction_ratio is not None and not 0 < compaction_ratio < 1:
+            raise ValueError(
+                f'compaction_ratio must be between 0 and 1, got {compaction_ratio}')
+        self.compaction_ratio = compaction_ratio
+        self.__heap = MinHeap()
+        self.__sequence = itertools.count()
+        self.__tombstones = 0
+
+    def __len__(self) -> int:
+        """ Active timers, not counting tombstones """
+        return len(self.__heap) - self.__tombstones
+
+    @property
+    def nodes(self) -> List[List[Any]]:
+        """ Heap array, tombstones included """
+        return self.__heap.nodes
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    def add(self, deadline: Any, item: Any = None) -> Timer:
+        timer = Timer(deadline, item)
+        self.__heap.add([deadline, next(self.__sequence), timer])
+        if len(self.__heap) == MIN_COMPACTION_SIZE and self.__tombstones:
+            # Adding only lowers the share of tombstones, except that
+            # reaching MIN_COMPACTION_SIZE can make a compaction due
+            self.__maybe_compact()
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """
+        Cancels a timer in O(1) amortized. Returns False if it was polled or
+        cancelled already.
+        """
+        if not timer.active:
+            return False
+        timer.active = False
+        self.__tombstones += 1
+        self.__maybe_compact()
+        return True
+
+    def __maybe_compact(self):
+        size = len(self.__heap)
+        if (self.compaction_ratio is not None and size >= MIN_COMPACTION_SIZE
+                and self.__tombstones > self.compaction_ratio * size):
+            self.compact()
+
+    def compact(self):
+        """ Drops every tombstone and heapifies the rest, in O(n) """
+        active = [node for node in self.__heap.nodes if node[2].active]
+        self.__heap = MinHeap(active, copy=False)
+        self.__tombstones = 0
+
+    def __drop_tombstones(self):
+        heap = self.__heap
+        nodes = heap.nodes
+        while self.__tombstones and nodes and not nodes[0][2].active:
+            heap.poll()
+            self.__tombstones -= 1
+
+    def peek(self) -> Optional[Timer]:
+        self.__drop_tombstones()
+        node = self.__heap.peek()
+        return None if node is None else node[2]
+
+    def poll(self) -> Optional[Timer]:
+        """ Polls the active timer with the earliest deadline """
+        self.__drop_tombstones()
+        if self.__heap.is_empty():
+            print('Empty, not polling')
+            return None
+        timer = self.__heap.poll()[2]
+        timer.active = False
+        # Polling shrinks the heap, raising the share of tombstones too
+        self.__maybe_compact()
+        return timer
+
+    def poll_due(self, now: Any) -> List[Timer]:
+        """ Polls every active timer with a deadline up to now, earliest first """
+        due = []
+        while True:
+            timer = self.peek()
+            if timer is None or now < timer.deadline:
+                return due
+            due.append(self.poll())
+
+
+if __name__ == '__main__':
+    timers = TimerHeap()
+    requests = [timers.add(deadline, f'timeout-{deadline}')
+                for deadline in (30, 10, 20, 40)]
+    # Responses arrived in time, cancel their timeouts
+    timers.cancel(requests[1])
+    timers.cancel(requests[3])
+    print(f'due at 35: {[timer.item for timer in timers.poll_due(35)]}')
+    print(f'left: {len(timers)}, cancel again: {timers.cancel(requests[1])}')
+    # due at 35: ['timeout-20', 'timeout-30']
+    # left: 0, cancel again: False